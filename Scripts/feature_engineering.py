@@ -2,7 +2,10 @@
 Comprehensive Feature Engineering Pipeline
 Consolidates and enhances features from both clean_data.py and FeatureEngineering.py
 """
+import ast
 import json
+import math
+import multiprocessing
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -17,17 +20,96 @@ try:
 except ImportError:
     PYCOUNTRY_AVAILABLE = False
 
+# Optional streaming JSON parsing to cap peak memory on large input files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional fast JSON parsing/serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional JIT compilation for the salary digit filter
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Compiled once; strips everything but digits from salary strings
+_NON_DIGIT = re.compile(r'[^\d]')
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _digits_only_kernel(buf, offsets):
+        """Parse the digits of each [offsets[i], offsets[i+1]) slice of buf"""
+        out = np.empty(len(offsets) - 1, np.int64)
+        for i in range(len(offsets) - 1):
+            value = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                char = buf[j]
+                if 48 <= char <= 57:
+                    value = value * 10 + (char - 48)
+            out[i] = value
+        return out
+
 class ComprehensiveFeatureEngineer:
-    def __init__(self, json_file_path):
-        """Initialize with candidate data from JSON file"""
-        with open(json_file_path, 'r') as f:
-            self.raw_data = json.load(f)
-        
+    def __init__(self, json_file_path=None, records=None):
+        """Initialize with candidate data from a JSON file or pre-loaded records"""
+        if records is not None:
+            self.raw_data = records
+        elif IJSON_AVAILABLE:
+            # Stream records incrementally instead of materializing the
+            # whole parse tree at once
+            with open(json_file_path, 'rb') as f:
+                self.raw_data = list(ijson.items(f, 'item'))
+        elif ORJSON_AVAILABLE:
+            with open(json_file_path, 'rb') as f:
+                self.raw_data = orjson.loads(f.read())
+        else:
+            with open(json_file_path, 'r') as f:
+                self.raw_data = json.load(f)
+
+        # One normalization pass so the extraction loops downstream can
+        # assume list-of-dict shapes without per-element isinstance checks
+        for candidate in self.raw_data:
+            if isinstance(candidate, dict):
+                self._normalize_candidate(candidate)
+
         # Initialize scorer
         self.scorer = CandidateScorer()
+
+        # Cache of country -> (continent, timezone_group) resolutions
+        self._country_cache = {}
         
         print(f"📊 Loaded {len(self.raw_data)} candidates for feature engineering")
 
+    @staticmethod
+    def _normalize_candidate(candidate):
+        """Coerce nested fields to their expected shapes in place
+
+        Drops non-dict work experience and degree entries once at load so
+        the hot extraction loops never re-check element types.
+        """
+        experiences = candidate.get('work_experiences')
+        candidate['work_experiences'] = (
+            [exp for exp in experiences if isinstance(exp, dict)]
+            if isinstance(experiences, list) else []
+        )
+        education = candidate.get('education')
+        if isinstance(education, dict):
+            degrees = education.get('degrees')
+            education['degrees'] = (
+                [degree for degree in degrees if isinstance(degree, dict)]
+                if isinstance(degrees, list) else []
+            )
+        return candidate
+
     def extract_salary_features(self, annual_salary_expectation):
         """Extract salary features from nested dict"""
         if not annual_salary_expectation:
@@ -42,7 +124,7 @@ class ComprehensiveFeatureEngineer:
             if not salary_str:
                 return 0
             if isinstance(salary_str, str):
-                numeric = re.sub(r'[^\d]', '', salary_str)
+                numeric = _NON_DIGIT.sub('', salary_str)
                 return int(numeric) if numeric else 0
             return salary_str
         
@@ -56,6 +138,35 @@ class ComprehensiveFeatureEngineer:
             'salary_ratio_pt_ft': part_time / full_time if full_time > 0 else 0
         }
 
+    def _clean_salary_series(self, salary_series):
+        """Vectorized version of clean_salary over a full column"""
+        if NUMBA_AVAILABLE:
+            # Same numeric guard as the fallback path: only entries
+            # to_numeric can't convert are packed into the byte buffer for
+            # the JIT-compiled digit filter, so numeric salaries never get
+            # their decimal point stripped
+            numeric = pd.to_numeric(salary_series, errors='coerce')
+            needs_strip = numeric.isna() & salary_series.notna()
+            if needs_strip.any():
+                encoded = [str(value).encode() for value in salary_series[needs_strip]]
+                offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+                np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+                buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+                numeric[needs_strip] = _digits_only_kernel(buf, offsets)
+            return numeric.fillna(0).astype(np.int64)
+
+        # Already-numeric values convert directly — digit-stripping their
+        # string form would drop the decimal point and inflate them 10x.
+        # Only entries to_numeric can't handle get the strip treatment.
+        numeric = pd.to_numeric(salary_series, errors='coerce')
+        needs_strip = numeric.isna() & salary_series.notna()
+        if needs_strip.any():
+            numeric[needs_strip] = pd.to_numeric(
+                salary_series[needs_strip].astype(str).str.replace(_NON_DIGIT, '', regex=True),
+                errors='coerce'
+            )
+        return numeric.fillna(0).astype(np.int64)
+
     def extract_work_availability_features(self, work_availability):
         """Extract work availability features from list"""
         if not work_availability:
@@ -89,109 +200,109 @@ class ComprehensiveFeatureEngineer:
                 'has_big_tech': False,
                 'has_senior_role': False,
                 'has_lead_role': False,
-                'most_common_role_type': 'None',
                 'experience_diversity_score': 0,
                 'company_prestige_score': 0,
                 'avg_prestige_per_role': 0
             }
         
-        companies = [exp.get('company', '') for exp in work_experiences if isinstance(exp, dict)]
-        roles = [exp.get('roleName', '') for exp in work_experiences if isinstance(exp, dict)]
-        
-        # Extract features
-        unique_companies = len(set(companies))
-        has_big_tech = any(any(tech in company for tech in self.scorer.big_tech_companies) for company in companies)
-        has_senior_role = any(any(keyword in role for keyword in self.scorer.senior_keywords) for role in roles)
-        has_lead_role = any(any(keyword in role for keyword in ['Lead', 'Manager', 'Director', 'VP', 'CTO']) for role in roles)
-        
-        # Role type analysis
-        role_types = []
-        for role in roles:
-            role_lower = role.lower()
-            if 'engineer' in role_lower or 'developer' in role_lower:
-                role_types.append('Engineering')
-            elif 'manager' in role_lower or 'lead' in role_lower:
-                role_types.append('Management')
-            elif 'analyst' in role_lower or 'data' in role_lower:
-                role_types.append('Analytics')
-            elif 'researcher' in role_lower:
-                role_types.append('Research')
-            else:
-                role_types.append('Other')
-        
-        most_common_role = Counter(role_types).most_common(1)[0][0] if role_types else 'None'
-        
-        # Company prestige scoring
+        # Single fused pass: companies, roles, big-tech flag, and prestige
+        # are all accumulated in one traversal
+        unique_companies = set()
+        roles = []
         prestige_score = 0
-        for company in companies:
-            if any(tech in company for tech in self.scorer.big_tech_companies):
+        has_big_tech = False
+        for exp in work_experiences:
+            company = exp.get('company', '')
+            unique_companies.add(company)
+            roles.append(exp.get('roleName', ''))
+
+            # Company prestige scoring
+            if self.scorer.big_tech_pattern.search(company):
                 prestige_score += 10
+                has_big_tech = True
             elif 'University' in company or 'Institute' in company:
                 prestige_score += 5
             else:
                 prestige_score += 1
-        
+
+        # One pattern scan over the joined roles instead of a substring
+        # check per keyword per entry
+        roles_joined = ' | '.join(roles)
+        has_senior_role = bool(self.scorer.senior_pattern.search(roles_joined))
+        has_lead_role = bool(self.scorer.lead_pattern.search(roles_joined))
+
         return {
             'total_experiences': len(work_experiences),
-            'unique_companies': unique_companies,
+            'unique_companies': len(unique_companies),
             'has_big_tech': has_big_tech,
             'has_senior_role': has_senior_role,
             'has_lead_role': has_lead_role,
-            'most_common_role_type': most_common_role,
-            'experience_diversity_score': unique_companies / len(work_experiences) if work_experiences else 0,
+            'experience_diversity_score': len(unique_companies) / len(work_experiences) if work_experiences else 0,
             'company_prestige_score': prestige_score,
             'avg_prestige_per_role': prestige_score / len(work_experiences) if work_experiences else 0
         }
 
-    def extract_education_features(self, education):
-        """Extract education features from nested dict"""
-        if not education:
-            return {
-                'highest_education_level': 'None',
-                'total_degrees': 0,
-                'has_cs_degree': False,
-                'has_top_school': False,
-                'has_high_gpa': False
-            }
-        
-        highest_level = education.get('highest_level', '')
-        degrees = education.get('degrees', [])
-        
-        if not degrees or not isinstance(degrees, list):
-            return {
-                'highest_education_level': highest_level,
-                'total_degrees': 0,
-                'has_cs_degree': False,
-                'has_top_school': False,
-                'has_high_gpa': False
-            }
-        
-        # CS/Tech related subjects
-        tech_subjects = ['Computer Science', 'Information Technology', 'Software', 'Data Science', 'Machine Learning']
-        
-        has_cs_degree = any(
-            any(subject in degree.get('subject', '') for subject in tech_subjects)
-            for degree in degrees if isinstance(degree, dict)
-        )
-        
-        has_top_school = any(
-            degree.get('isTop50', False) or degree.get('isTop25', False) 
-            for degree in degrees if isinstance(degree, dict)
-        )
-        
-        has_high_gpa = any(
-            'GPA 3.5-3.9' in degree.get('gpa', '') or 'GPA 4.0' in degree.get('gpa', '') or 
-            'Summa Cum Laude' in degree.get('gpa', '') or 'Cum Laude' in degree.get('gpa', '')
-            for degree in degrees if isinstance(degree, dict)
+    # Role-type labels in the bucket order used by _most_common_role_types
+    ROLE_TYPE_LABELS = np.array(['Engineering', 'Management', 'Analytics', 'Research', 'Other'])
+
+    def _most_common_role_types(self, work_experiences):
+        """Vectorized most-common role type per candidate via a bucketed argmax"""
+        roles = work_experiences.map(
+            lambda exps: [exp.get('roleName', '') for exp in exps]
         )
-        
-        return {
+        role_lower = roles.explode().dropna().str.lower()
+
+        # First-match buckets mirroring the original if/elif classification
+        engineering = role_lower.str.contains('engineer|developer', regex=True)
+        management = role_lower.str.contains('manager|lead', regex=True) & ~engineering
+        analytics = role_lower.str.contains('analyst|data', regex=True) & ~engineering & ~management
+        research = role_lower.str.contains('researcher') & ~engineering & ~management & ~analytics
+        buckets = pd.DataFrame({
+            'Engineering': engineering,
+            'Management': management,
+            'Analytics': analytics,
+            'Research': research,
+            'Other': ~(engineering | management | analytics | research)
+        })
+
+        counts = buckets.groupby(level=0).sum()
+        most_common = pd.Series('None', index=work_experiences.index)
+        most_common.loc[counts.index] = self.ROLE_TYPE_LABELS[counts.values.argmax(axis=1)]
+        return most_common
+
+    # CS/Tech related subjects and strong GPA markers
+    TECH_SUBJECTS = ['Computer Science', 'Information Technology', 'Software', 'Data Science', 'Machine Learning']
+    HIGH_GPA_MARKERS = ['GPA 3.5-3.9', 'GPA 4.0', 'Summa Cum Laude', 'Cum Laude']
+
+    def extract_education_features(self, education):
+        """Extract education features for the full education column at once"""
+        highest_level = education.map(lambda e: e.get('highest_level', '') if e else 'None')
+        degrees = education.map(
+            lambda e: e.get('degrees', []) if e else []
+        ).map(lambda d: d if isinstance(d, list) else [])
+
+        features = pd.DataFrame({
             'highest_education_level': highest_level,
-            'total_degrees': len(degrees),
-            'has_cs_degree': has_cs_degree,
-            'has_top_school': has_top_school,
-            'has_high_gpa': has_high_gpa
-        }
+            'total_degrees': degrees.str.len(),
+            'has_cs_degree': False,
+            'has_top_school': False,
+            'has_high_gpa': False
+        })
+
+        # Explode degrees once and run the membership checks as single
+        # str.contains passes, aggregated back per candidate
+        flat_degrees = degrees.explode().dropna()
+        if len(flat_degrees) > 0:
+            tech_pattern = '|'.join(map(re.escape, self.TECH_SUBJECTS))
+            gpa_pattern = '|'.join(map(re.escape, self.HIGH_GPA_MARKERS))
+            degree_flags = pd.DataFrame({
+                'has_cs_degree': flat_degrees.map(lambda d: d.get('subject', '')).str.contains(tech_pattern, regex=True, na=False),
+                'has_top_school': flat_degrees.map(lambda d: bool(d.get('isTop50', False) or d.get('isTop25', False))),
+                'has_high_gpa': flat_degrees.map(lambda d: d.get('gpa', '')).str.contains(gpa_pattern, regex=True, na=False)
+            }).groupby(level=0).any()
+            features.loc[degree_flags.index, degree_flags.columns] = degree_flags.values
+
+        return features
 
     def extract_skills_features(self, skills):
         """Extract comprehensive skills features"""
@@ -212,17 +323,14 @@ class ComprehensiveFeatureEngineer:
                 'primary_skill_category': 'None'
             }
         
-        # Convert to list if not already
-        if not isinstance(skills, list):
-            skills = [skills] if skills else []
-        
-        # Count skills per category
-        category_counts = {}
-        for category, category_skills in self.scorer.skill_categories.items():
-            count = sum(1 for skill in skills if skill in category_skills)
-            category_counts[category] = count
-        
-        high_demand_count = sum(1 for skill in skills if skill in self.scorer.high_demand_skills)
+        # Normalize once and count per category via set intersections
+        skills = self.scorer._as_skill_set(skills)
+        category_counts = {
+            category: len(skills & category_skills)
+            for category, category_skills in self.scorer.skill_categories.items()
+        }
+
+        high_demand_count = len(skills & self.scorer.high_demand_skills)
         
         # Determine primary category
         primary_category = max(category_counts, key=category_counts.get) if any(category_counts.values()) else 'None'
@@ -250,6 +358,62 @@ class ComprehensiveFeatureEngineer:
             'primary_skill_category': primary_category
         }
 
+    # Major tech hubs, compiled once into a single lowercase alternation
+    TECH_HUBS = ['San Francisco', 'New York', 'Seattle', 'Austin', 'Boston', 'Toronto', 'Berlin', 'London', 'Bangalore', 'Sydney']
+    TECH_HUB_PATTERN = re.compile('|'.join(re.escape(hub.lower()) for hub in TECH_HUBS))
+
+    # Fallback mappings for countries pycountry_convert cannot resolve
+    CONTINENT_FALLBACK = {
+        'United States': 'North America', 'Canada': 'North America', 'Mexico': 'North America',
+        'Brazil': 'South America', 'Argentina': 'South America', 'Peru': 'South America',
+        'Germany': 'Europe', 'Spain': 'Europe', 'United Kingdom': 'Europe', 'France': 'Europe',
+        'India': 'Asia', 'Pakistan': 'Asia', 'Bangladesh': 'Asia', 'China': 'Asia',
+        'Australia': 'Oceania', 'Egypt': 'Africa'
+    }
+    TIMEZONE_FALLBACK = {
+        'United States': 'Americas', 'Canada': 'Americas', 'Brazil': 'Americas', 'Argentina': 'Americas',
+        'Germany': 'Europe', 'Spain': 'Europe', 'United Kingdom': 'Europe',
+        'India': 'Asia', 'Pakistan': 'Asia', 'Bangladesh': 'Asia', 'China': 'Asia',
+        'Australia': 'Asia-Pacific'
+    }
+    CONTINENT_NAMES = {
+        'NA': 'North America', 'SA': 'South America', 'AS': 'Asia',
+        'OC': 'Oceania', 'EU': 'Europe', 'AF': 'Africa'
+    }
+    # Simplified timezone grouping based on continent
+    CONTINENT_TIMEZONES = {
+        'North America': 'Americas',
+        'South America': 'Americas',
+        'Europe': 'Europe/Africa',
+        'Africa': 'Europe/Africa',
+        'Asia': 'Asia',
+        'Oceania': 'Asia-Pacific'
+    }
+
+    def _resolve_country(self, country):
+        """Resolve (continent, timezone_group) for a country, cached per distinct name"""
+        cached = self._country_cache.get(country)
+        if cached is not None:
+            return cached
+
+        # Use pycountry_convert if available, otherwise fallback
+        if PYCOUNTRY_AVAILABLE:
+            try:
+                country_code = country_name_to_country_alpha2(country)
+                continent_code = country_alpha2_to_continent_code(country_code)
+                continent = self.CONTINENT_NAMES.get(continent_code, 'Other')
+                timezone_group = self.CONTINENT_TIMEZONES.get(continent, 'Other')
+            except (KeyError, Exception):
+                # Fallback for countries not found in the library
+                continent = self.CONTINENT_FALLBACK.get(country, 'Other')
+                timezone_group = self.TIMEZONE_FALLBACK.get(country, 'Other')
+        else:
+            continent = self.CONTINENT_FALLBACK.get(country, 'Other')
+            timezone_group = self.TIMEZONE_FALLBACK.get(country, 'Other')
+
+        self._country_cache[country] = (continent, timezone_group)
+        return continent, timezone_group
+
     def extract_location_features(self, location):
         """Extract location and geographic diversity features using your enhanced approach"""
         if not location:
@@ -261,64 +425,17 @@ class ComprehensiveFeatureEngineer:
                 'is_major_tech_hub': False
             }
         
-        # Extract country (usually last part after comma)
-        location_parts = location.split(',')
-        country = location_parts[-1].strip() if location_parts else location
-        city = location_parts[0].strip() if len(location_parts) > 1 else location
-        
-        # Fallback mappings
-        continent_mapping = {
-            'United States': 'North America', 'Canada': 'North America', 'Mexico': 'North America',
-            'Brazil': 'South America', 'Argentina': 'South America', 'Peru': 'South America',
-            'Germany': 'Europe', 'Spain': 'Europe', 'United Kingdom': 'Europe', 'France': 'Europe',
-            'India': 'Asia', 'Pakistan': 'Asia', 'Bangladesh': 'Asia', 'China': 'Asia',
-            'Australia': 'Oceania', 'Egypt': 'Africa'
-        }
-        
-        timezone_mapping = {
-            'United States': 'Americas', 'Canada': 'Americas', 'Brazil': 'Americas', 'Argentina': 'Americas',
-            'Germany': 'Europe', 'Spain': 'Europe', 'United Kingdom': 'Europe',
-            'India': 'Asia', 'Pakistan': 'Asia', 'Bangladesh': 'Asia', 'China': 'Asia',
-            'Australia': 'Asia-Pacific'
-        }
-        
-        continent = 'Unknown'
-        timezone_group = 'Unknown'
-
-        # Use pycountry_convert if available, otherwise fallback
-        if PYCOUNTRY_AVAILABLE:
-            try:
-                country_code = country_name_to_country_alpha2(country)
-                continent_code = country_alpha2_to_continent_code(country_code)
-                continent_names = {
-                    'NA': 'North America', 'SA': 'South America', 'AS': 'Asia',
-                    'OC': 'Oceania', 'EU': 'Europe', 'AF': 'Africa'
-                }
-                continent = continent_names.get(continent_code, 'Other')
-
-                # Simplified timezone grouping based on continent
-                timezone_map = {
-                    'North America': 'Americas',
-                    'South America': 'Americas',
-                    'Europe': 'Europe/Africa',
-                    'Africa': 'Europe/Africa',
-                    'Asia': 'Asia',
-                    'Oceania': 'Asia-Pacific'
-                }
-                timezone_group = timezone_map.get(continent, 'Other')
+        # Extract country (usually last part after comma) — rpartition
+        # avoids allocating a list for every location string
+        _, separator, country_part = location.rpartition(',')
+        country = country_part.strip()
+        city = location.partition(',')[0].strip() if separator else location
 
-            except (KeyError, Exception):
-                # Fallback for countries not found in the library
-                continent = continent_mapping.get(country, 'Other')
-                timezone_group = timezone_mapping.get(country, 'Other')
-        else:
-            # Use fallback mappings
-            continent = continent_mapping.get(country, 'Other')
-            timezone_group = timezone_mapping.get(country, 'Other')
+        continent, timezone_group = self._resolve_country(country)
         
-        # Major tech hubs
-        tech_hubs = ['San Francisco', 'New York', 'Seattle', 'Austin', 'Boston', 'Toronto', 'Berlin', 'London', 'Bangalore', 'Sydney']
-        is_tech_hub = any(hub.lower() in location.lower() for hub in tech_hubs)
+        # Major tech hubs: one compiled-alternation scan instead of a
+        # substring check per hub
+        is_tech_hub = bool(self.TECH_HUB_PATTERN.search(location.lower()))
         
         return {
             'country': country,
@@ -328,146 +445,289 @@ class ComprehensiveFeatureEngineer:
             'is_major_tech_hub': is_tech_hub
         }
 
-    def engineer_all_features(self):
-        """Main function to engineer all features with dual scoring"""
-        engineered_data = []
-        
+    def _raw_column(self, df, name, default):
+        """Get a raw column with missing/NaN entries normalized to a default"""
+        if name not in df.columns:
+            return pd.Series([default] * len(df), index=df.index)
+        default_type = type(default)
+        if default_type is list:
+            # Mirror the scalar-to-list wrapping done by the extractors
+            return df[name].map(
+                lambda v: v if isinstance(v, list) else ([v] if isinstance(v, str) and v else [])
+            )
+        return df[name].map(lambda v: v if isinstance(v, default_type) else default)
+
+    # Typed column layouts for the per-candidate extractor results,
+    # preallocated as NumPy arrays instead of transposing lists of dicts
+    EXPERIENCE_COLUMNS = {
+        'total_experiences': np.int16, 'unique_companies': np.int16,
+        'has_big_tech': np.bool_, 'has_senior_role': np.bool_, 'has_lead_role': np.bool_,
+        'experience_diversity_score': np.float64, 'company_prestige_score': np.int16,
+        'avg_prestige_per_role': np.float64
+    }
+    SKILLS_COLUMNS = {
+        'total_skills': np.int16, 'frontend_skills': np.int8, 'backend_skills': np.int8,
+        'mobile_skills': np.int8, 'data_skills': np.int8, 'cloud_skills': np.int8,
+        'database_skills': np.int8, 'devops_skills': np.int8, 'language_skills': np.int8,
+        'is_full_stack': np.bool_, 'high_demand_skills': np.int8,
+        'skills_diversity_score': np.float64, 'primary_skill_category': object
+    }
+    LOCATION_COLUMNS = {
+        'country': object, 'city': object, 'continent': object,
+        'timezone_group': object, 'is_major_tech_hub': np.bool_
+    }
+
+    @staticmethod
+    def _columnar_frame(records, column_dtypes):
+        """Fill preallocated typed arrays from record dicts (AoS -> SoA)"""
+        n = len(records)
+        columns = {
+            name: np.empty(n, dtype=dtype) if dtype is object else np.zeros(n, dtype=dtype)
+            for name, dtype in column_dtypes.items()
+        }
+        for i, record in enumerate(records):
+            for name, value in record.items():
+                columns[name][i] = value
+        return pd.DataFrame(columns)
+
+    def engineer_all_features(self, n_workers=None):
+        """Main function to engineer all features with dual scoring
+
+        Pass n_workers > 1 to shard the remaining per-candidate Python work
+        across a process pool.
+        """
+        if n_workers and n_workers > 1 and len(self.raw_data) > n_workers:
+            print(f"🔧 Engineering features across {n_workers} worker processes...")
+            chunk_size = math.ceil(len(self.raw_data) / n_workers)
+            shards = [self.raw_data[i:i + chunk_size] for i in range(0, len(self.raw_data), chunk_size)]
+            with multiprocessing.Pool(n_workers) as pool:
+                frames = pool.map(_engineer_shard, shards)
+            engineered_df = pd.concat(frames, ignore_index=True)
+            # Shard-local candidate ids restart at 0, so reassign globally
+            engineered_df['candidate_id'] = np.arange(len(engineered_df))
+            return engineered_df
+
         print("🔧 Engineering features for all candidates...")
-        
-        for i, candidate in enumerate(self.raw_data):
-            try:
-                # Extract basic info
-                basic_features = {
-                    'candidate_id': i,
-                    'name': candidate.get('name', ''),
-                    'email': candidate.get('email', ''),
-                    'phone': candidate.get('phone', ''),
-                    'submitted_at': candidate.get('submitted_at', '')
-                }
-                
-                # Extract complex features
-                salary_features = self.extract_salary_features(candidate.get('annual_salary_expectation'))
-                availability_features = self.extract_work_availability_features(candidate.get('work_availability'))
-                experience_features = self.extract_work_experience_features(candidate.get('work_experiences'))
-                education_features = self.extract_education_features(candidate.get('education'))
-                skills_features = self.extract_skills_features(candidate.get('skills'))
-                location_features = self.extract_location_features(candidate.get('location'))
-                
-                # Calculate scores using both basic and detailed methods
-                basic_experience_score = self.scorer.calculate_experience_score_basic(candidate.get('work_experiences', []))
-                detailed_experience_score = self.scorer.calculate_experience_score_detailed(candidate.get('work_experiences', []))
-                
-                basic_skills_score, basic_skills_metrics = self.scorer.calculate_skills_score_basic(candidate.get('skills', []))
-                detailed_skills_score, detailed_skills_metrics = self.scorer.calculate_skills_score_detailed(candidate.get('skills', []))
-                
-                basic_education_score, basic_education_metrics = self.scorer.calculate_education_score_basic(candidate.get('education', {}))
-                detailed_education_score, detailed_education_metrics = self.scorer.calculate_education_score_detailed(candidate.get('education', {}))
-                
-                market_value_score = self.scorer.calculate_market_value_score(
-                    candidate.get('annual_salary_expectation', {}),
-                    candidate.get('location', ''),
-                    detailed_experience_score
-                )
-                
-                completeness_score = self.scorer.calculate_profile_completeness_score(candidate)
-                
-                # Combine all features
-                all_features = {
-                    **basic_features,
-                    **salary_features,
-                    **availability_features,
-                    **experience_features,
-                    **education_features,
-                    **skills_features,
-                    **location_features
-                }
-                
-                # Add scoring results
-                all_features.update({
-                    # Basic scoring (0-100 scale)
-                    'experience_score': basic_experience_score,
-                    'skills_score': basic_skills_score,
-                    'education_score': basic_education_score,
-                    'market_value_score': market_value_score,
-                    'completeness_score': completeness_score,
-                    
-                    # Detailed scoring (0-162 scale)
-                    'detailed_experience_score': detailed_experience_score,
-                    'detailed_skills_score': detailed_skills_score,
-                    'detailed_education_score': detailed_education_score,
-                })
-                
-                # Add detailed metrics
-                if detailed_skills_metrics:
-                    all_features.update({
-                        'detailed_skill_categories': detailed_skills_metrics.get('categories', []),
-                        'detailed_is_full_stack': detailed_skills_metrics.get('is_full_stack', False),
-                        'detailed_high_demand_count': detailed_skills_metrics.get('high_demand_skills', 0),
-                    })
-                
-                if detailed_education_metrics:
-                    all_features.update({
-                        'detailed_has_tech_degree': detailed_education_metrics.get('has_tech_degree', False),
-                        'detailed_top50_schools': detailed_education_metrics.get('top50_schools', 0),
-                        'detailed_top25_schools': detailed_education_metrics.get('top25_schools', 0),
-                    })
-                
-                # Calculate overall scores
-                all_features['overall_score'] = self.scorer.calculate_overall_score_basic(all_features)
-                all_features['enhanced_overall_score'] = self.scorer.calculate_overall_score_enhanced(all_features)
-                
-                # Add experience level categorization
-                all_features['experience_level'] = self.scorer.get_experience_level_category(basic_experience_score, use_enhanced=False)
-                all_features['enhanced_experience_level'] = self.scorer.get_experience_level_category(detailed_experience_score, use_enhanced=True)
-                
-                # Add original nested data for reference
-                all_features['original_skills'] = candidate.get('skills', [])
-                all_features['original_work_experiences'] = candidate.get('work_experiences', [])
-                
-                engineered_data.append(all_features)
-                
-            except Exception as e:
-                print(f"❌ Error processing candidate {i}: {e}")
-                continue
-        
-        print(f"✅ Successfully engineered features for {len(engineered_data)} candidates")
-        return pd.DataFrame(engineered_data)
+
+        # Materialize the raw data once and derive feature columns in bulk
+        # instead of building one dict per candidate
+        raw_df = pd.DataFrame(self.raw_data)
+
+        basic_features = pd.DataFrame({
+            'candidate_id': np.arange(len(raw_df)),
+            'name': self._raw_column(raw_df, 'name', ''),
+            'email': self._raw_column(raw_df, 'email', ''),
+            'phone': self._raw_column(raw_df, 'phone', ''),
+            'submitted_at': self._raw_column(raw_df, 'submitted_at', '')
+        })
+
+        # Normalized nested columns, shared by feature extraction and scoring
+        salary_expectations = self._raw_column(raw_df, 'annual_salary_expectation', {})
+        work_availability = self._raw_column(raw_df, 'work_availability', [])
+        work_experiences = self._raw_column(raw_df, 'work_experiences', [])
+        education = self._raw_column(raw_df, 'education', {})
+        skills = self._raw_column(raw_df, 'skills', [])
+        locations = self._raw_column(raw_df, 'location', '')
+
+        # Salary features: clean both salary columns with one vectorized pass each
+        full_time = self._clean_salary_series(salary_expectations.map(lambda d: d.get('full-time', 0)))
+        part_time = self._clean_salary_series(salary_expectations.map(lambda d: d.get('part-time', 0)))
+        salary_features = pd.DataFrame({
+            'salary_full_time': full_time,
+            'salary_part_time': part_time,
+            'has_salary_info': (full_time > 0) | (part_time > 0),
+            'salary_ratio_pt_ft': np.where(full_time > 0, part_time / full_time.replace(0, 1), 0)
+        })
+
+        # Availability features
+        is_full_time = work_availability.map(lambda avail: 'full-time' in avail)
+        is_part_time = work_availability.map(lambda avail: 'part-time' in avail)
+        availability_features = pd.DataFrame({
+            'available_full_time': is_full_time,
+            'available_part_time': is_part_time,
+            'availability_flexibility': work_availability.str.len(),
+            'both_available': is_full_time & is_part_time
+        })
+
+        # Complex nested features: one extractor pass per column, collected
+        # straight into preallocated typed arrays
+        experience_features = self._columnar_frame(
+            work_experiences.map(self.extract_work_experience_features).tolist(), self.EXPERIENCE_COLUMNS)
+        experience_features['most_common_role_type'] = self._most_common_role_types(work_experiences)
+        education_features = self.extract_education_features(education)
+        # One frozenset per candidate; the batch scorer's single exploded
+        # pass feeds both the skills feature frame and the score columns
+        skills_sets = skills.map(frozenset)
+        skills_batch = self.scorer.score_skills_batch(skills_sets)
+        skills_features = pd.DataFrame({
+            'total_skills': skills_batch['total_skills'],
+            'frontend_skills': skills_batch['frontend'],
+            'backend_skills': skills_batch['backend'],
+            'mobile_skills': skills_batch['mobile'],
+            'data_skills': skills_batch['data'],
+            'cloud_skills': skills_batch['cloud'],
+            'database_skills': skills_batch['database'],
+            'devops_skills': skills_batch['devops'],
+            'language_skills': skills_batch['languages'],
+            'is_full_stack': skills_batch['is_full_stack'],
+            'high_demand_skills': skills_batch['high_demand_skills'],
+            'skills_diversity_score': skills_batch['skills_diversity_score'],
+            'primary_skill_category': skills_batch['primary_skill_category']
+        }).astype(self.SKILLS_COLUMNS)
+        location_features = self._columnar_frame(
+            locations.map(self.extract_location_features).tolist(), self.LOCATION_COLUMNS)
+
+        # Scoring: the skills and experience scorers run as single batch
+        # calls over the whole Series; education stays per-row for now
+        experience_batch = self.scorer.score_experience_batch(work_experiences)
+        experience_score = experience_batch['experience_score_basic']
+        detailed_experience_score = experience_batch['experience_score_detailed']
+
+        basic_education_results = education.map(self.scorer.calculate_education_score_basic)
+        detailed_education_results = education.map(self.scorer.calculate_education_score_detailed)
+
+        market_value_score = pd.Series([
+            self.scorer.calculate_market_value_score(salary, location, detailed_exp)
+            for salary, location, detailed_exp in zip(salary_expectations, locations, detailed_experience_score)
+        ])
+
+        completeness_score = pd.Series([
+            self.scorer.calculate_profile_completeness_score(candidate)
+            for candidate in self.raw_data
+        ])
+
+        detailed_education_metrics = detailed_education_results.map(lambda result: result[1])
+
+        score_features = pd.DataFrame({
+            # Basic scoring (0-100 scale)
+            'experience_score': experience_score,
+            'skills_score': skills_batch['skills_score_basic'],
+            'education_score': basic_education_results.map(lambda result: result[0]),
+            'market_value_score': market_value_score,
+            'completeness_score': completeness_score,
+
+            # Detailed scoring (0-162 scale)
+            'detailed_experience_score': detailed_experience_score,
+            'detailed_skills_score': skills_batch['skills_score_detailed'],
+            'detailed_education_score': detailed_education_results.map(lambda result: result[0]),
+
+            # Detailed metrics
+            'detailed_skill_categories': skills_batch['categories'],
+            'detailed_is_full_stack': skills_batch['is_full_stack'],
+            'detailed_high_demand_count': skills_batch['high_demand_skills'],
+            'detailed_has_tech_degree': detailed_education_metrics.map(lambda m: m.get('has_tech_degree', False)),
+            'detailed_top50_schools': detailed_education_metrics.map(lambda m: m.get('top50_schools', 0)),
+            'detailed_top25_schools': detailed_education_metrics.map(lambda m: m.get('top25_schools', 0)),
+        })
+
+        # Overall scores: vectorized equivalents of the scorer's weighted sums
+        score_features['overall_score'] = np.minimum(
+            score_features['experience_score'] + score_features['skills_score'] +
+            score_features['education_score'] + score_features['market_value_score'] +
+            np.minimum(score_features['completeness_score'] * (10 / 12), 10),
+            100
+        )
+        score_features['enhanced_overall_score'] = np.minimum(
+            score_features['detailed_experience_score'] + score_features['detailed_skills_score'] +
+            score_features['detailed_education_score'] + score_features['market_value_score'] +
+            score_features['completeness_score'],
+            162
+        )
+
+        # Experience level categorization: one searchsorted pass over the
+        # threshold bins per column instead of a Python call per candidate
+        level_labels = np.array(self.scorer._LEVEL_LABELS)
+        score_features['experience_level'] = level_labels[np.searchsorted(
+            self.scorer._BASIC_LEVEL_BINS, experience_score.to_numpy(), side='right'
+        )]
+        score_features['enhanced_experience_level'] = level_labels[np.searchsorted(
+            self.scorer._ENHANCED_LEVEL_BINS, detailed_experience_score.to_numpy(), side='right'
+        )]
+
+        # Original nested data for reference
+        score_features['original_skills'] = skills
+        score_features['original_work_experiences'] = work_experiences
+
+        engineered_df = self._narrow_dtypes(pd.concat([
+            basic_features, salary_features, availability_features,
+            experience_features, education_features, skills_features,
+            location_features, score_features
+        ], axis=1))
+
+        print(f"✅ Successfully engineered features for {len(engineered_df)} candidates")
+        return engineered_df
+
+    # Narrow dtypes for the engineered frame: flags as bool, counts as
+    # int8/int16, low-cardinality strings as category
+    DTYPE_NARROWING = {
+        'has_salary_info': 'bool', 'available_full_time': 'bool', 'available_part_time': 'bool',
+        'both_available': 'bool', 'has_big_tech': 'bool', 'has_senior_role': 'bool',
+        'has_lead_role': 'bool', 'has_cs_degree': 'bool', 'has_top_school': 'bool',
+        'has_high_gpa': 'bool', 'is_full_stack': 'bool', 'is_major_tech_hub': 'bool',
+        'detailed_is_full_stack': 'bool', 'detailed_has_tech_degree': 'bool',
+        'total_experiences': 'int16', 'unique_companies': 'int16', 'total_degrees': 'int8',
+        'availability_flexibility': 'int8', 'company_prestige_score': 'int16',
+        'total_skills': 'int16', 'frontend_skills': 'int8', 'backend_skills': 'int8',
+        'mobile_skills': 'int8', 'data_skills': 'int8', 'cloud_skills': 'int8',
+        'database_skills': 'int8', 'devops_skills': 'int8', 'language_skills': 'int8',
+        'high_demand_skills': 'int8', 'detailed_high_demand_count': 'int8',
+        'detailed_top50_schools': 'int8', 'detailed_top25_schools': 'int8',
+        'country': 'category', 'city': 'category', 'continent': 'category',
+        'timezone_group': 'category', 'primary_skill_category': 'category',
+        'most_common_role_type': 'category', 'highest_education_level': 'category',
+        'experience_level': 'category', 'enhanced_experience_level': 'category'
+    }
+
+    def _narrow_dtypes(self, df):
+        """Downcast engineered columns to compact dtypes"""
+        return df.astype({col: dtype for col, dtype in self.DTYPE_NARROWING.items() if col in df.columns})
+
+    # Precomputed tier bins and display-time label maps (code -1 = out of range)
+    VALUE_TIER_BINS = np.array([0, 50, 70, 85, 100], dtype=np.int16)
+    ENHANCED_VALUE_TIER_BINS = np.array([0, 80, 110, 140, 162], dtype=np.int16)
+    EXPERIENCE_TIER_BINS = np.array([-1, 0, 2, 5, 20], dtype=np.int16)
+    BUDGET_CATEGORY_BINS = np.array([0, 60000, 100000, 140000, 300000], dtype=np.int32)
+    TIER_LABELS = {
+        'value_tier': {0: 'Low', 1: 'Medium', 2: 'High', 3: 'Excellent'},
+        'enhanced_value_tier': {0: 'Low', 1: 'Medium', 2: 'High', 3: 'Excellent'},
+        'experience_tier': {0: 'Entry', 1: 'Junior', 2: 'Mid', 3: 'Senior'},
+        'budget_category': {0: 'Budget', 1: 'Standard', 2: 'Premium', 3: 'Executive'}
+    }
+
+    @staticmethod
+    def _tier_codes(values, bins):
+        """Bin values and keep only the int8 codes, skipping Categorical labels"""
+        codes = pd.cut(values, bins=bins, labels=False)
+        return pd.Series(codes).fillna(-1).astype('int8')
+
+    @staticmethod
+    def _percentile_rank(values):
+        """Percentile ranks (0-100) via a double argsort, skipping Series.rank overhead"""
+        scores = np.asarray(values, dtype=np.float32)
+        order = scores.argsort(kind='stable')
+        ranks = np.empty(len(scores), dtype=np.float32)
+        ranks[order] = np.arange(len(scores), dtype=np.float32)
+        return (ranks + 1) / len(scores) * 100
 
     def create_team_selection_features(self, df):
         """Create additional features for team selection"""
         print("🎯 Creating team selection features...")
-        
+
         # Percentile rankings
-        df['score_percentile'] = df['overall_score'].rank(pct=True) * 100
-        df['enhanced_score_percentile'] = df['enhanced_overall_score'].rank(pct=True) * 100
-        df['salary_percentile'] = df['salary_full_time'].rank(pct=True) * 100
-        df['experience_percentile'] = df['company_prestige_score'].rank(pct=True) * 100
-        
-        # Value categories
-        df['value_tier'] = pd.cut(
-            df['overall_score'], 
-            bins=[0, 50, 70, 85, 100], 
-            labels=['Low', 'Medium', 'High', 'Excellent']
-        )
-        
-        df['enhanced_value_tier'] = pd.cut(
-            df['enhanced_overall_score'], 
-            bins=[0, 80, 110, 140, 162], 
-            labels=['Low', 'Medium', 'High', 'Excellent']
-        )
-        
-        df['experience_tier'] = pd.cut(
-            df['total_experiences'],
-            bins=[-1, 0, 2, 5, 20],
-            labels=['Entry', 'Junior', 'Mid', 'Senior']
-        )
-        
+        df['score_percentile'] = self._percentile_rank(df['overall_score'].values)
+        df['enhanced_score_percentile'] = self._percentile_rank(df['enhanced_overall_score'].values)
+        df['salary_percentile'] = self._percentile_rank(df['salary_full_time'].values)
+        df['experience_percentile'] = self._percentile_rank(df['company_prestige_score'].values)
+        
+        # Value categories, stored as int8 bin codes; save_results maps
+        # them through TIER_LABELS at CSV write time instead of
+        # materializing Categorical labels here
+        df['value_tier'] = self._tier_codes(df['overall_score'].values, self.VALUE_TIER_BINS)
+        df['enhanced_value_tier'] = self._tier_codes(df['enhanced_overall_score'].values, self.ENHANCED_VALUE_TIER_BINS)
+        df['experience_tier'] = self._tier_codes(df['total_experiences'].values, self.EXPERIENCE_TIER_BINS)
+
         # Budget categories
-        df['budget_category'] = pd.cut(
-            df['salary_full_time'],
-            bins=[0, 60000, 100000, 140000, 300000],
-            labels=['Budget', 'Standard', 'Premium', 'Executive']
-        )
+        df['budget_category'] = self._tier_codes(df['salary_full_time'].values, self.BUDGET_CATEGORY_BINS)
         
         # Value for money ratio
         df['value_for_money'] = df['overall_score'] / (df['salary_full_time'] / 1000).replace(0, np.inf)
@@ -478,6 +738,12 @@ class ComprehensiveFeatureEngineer:
 
     def generate_summary_statistics(self, df):
         """Generate comprehensive summary statistics"""
+        # Shared aggregations: one value_counts for countries and one
+        # groupby per grouping dimension, over categorical codes
+        top_countries = df['country'].value_counts().head(10)
+        salary_by_experience = df.groupby('experience_level', observed=True)['salary_full_time'].mean()
+        salary_by_country = df.groupby('country', observed=True)['salary_full_time'].mean().reindex(top_countries.index)
+
         summary = {
             'dataset_summary': {
                 'total_candidates': len(df),
@@ -500,63 +766,110 @@ class ComprehensiveFeatureEngineer:
                     'top_50_percent': len(df[df['enhanced_score_percentile'] >= 50])
                 }
             },
-            'geographic_distribution': df['country'].value_counts().head(10).to_dict(),
+            'geographic_distribution': top_countries.to_dict(),
             'experience_distribution': df['experience_level'].value_counts().to_dict(),
             'skill_category_distribution': df['primary_skill_category'].value_counts().to_dict(),
             'salary_statistics': {
-                'by_experience': df.groupby('experience_level')['salary_full_time'].mean().to_dict(),
-                'by_country': df.groupby('country')['salary_full_time'].mean().head(10).to_dict()
+                'by_experience': salary_by_experience.to_dict(),
+                'by_country': salary_by_country.to_dict()
             },
             'top_skills': self._get_top_skills(df)
         }
         
         return summary
 
+    @staticmethod
+    def _parse_skills_cell(skills_list):
+        """Normalize an original_skills cell to a list of skills"""
+        if isinstance(skills_list, list):
+            return skills_list
+        if isinstance(skills_list, str) and skills_list.startswith('[') and skills_list.endswith(']'):
+            try:
+                parsed = ast.literal_eval(skills_list)
+                if isinstance(parsed, list):
+                    return parsed
+            except (ValueError, SyntaxError):
+                pass
+        return []
+
     def _get_top_skills(self, df):
         """Extract top skills from the dataset"""
-        all_skills = []
-        for skills_list in df['original_skills'].dropna():
-            if isinstance(skills_list, list):
-                all_skills.extend(skills_list)
-            elif isinstance(skills_list, str) and skills_list != '[]':
-                try:
-                    skills = eval(skills_list)
-                    if isinstance(skills, list):
-                        all_skills.extend(skills)
-                except:
-                    continue
-        
-        return Counter(all_skills).most_common(20)
+        skills = df['original_skills'].dropna().map(self._parse_skills_cell)
+        return list(skills.explode().dropna().value_counts().head(20).items())
 
-    def save_results(self, df, base_filename='engineered_candidates'):
+    def save_results(self, df, base_filename='engineered_candidates', write_csv=True):
         """Save all results to files"""
         print("💾 Saving results...")
-        
-        # Save main CSV
-        csv_path = f'{base_filename}.csv'
-        df_save = df.copy()
-        
-        # Convert lists to strings for CSV compatibility
-        df_save['original_skills'] = df_save['original_skills'].apply(
-            lambda x: ', '.join(x) if isinstance(x, list) else str(x)
-        )
-        df_save['original_work_experiences'] = df_save['original_work_experiences'].apply(
-            lambda x: '; '.join([f"{exp.get('company', '')}: {exp.get('roleName', '')}" 
-                               for exp in x if isinstance(exp, dict)]) if isinstance(x, list) else str(x)
-        )
-        
-        df_save.to_csv(csv_path, index=False)
-        print(f"✅ Main dataset saved to {csv_path}")
-        
+
+        # Save Parquet first: preserves the narrowed dtypes and keeps list
+        # columns (e.g. original_skills) native, with no string conversion
+        try:
+            parquet_path = f'{base_filename}.parquet'
+            df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+            print(f"✅ Main dataset saved to {parquet_path}")
+        except ImportError:
+            print("⚠️ pyarrow not available, skipping Parquet output")
+
+        # Save CSV for consumers that still read it
+        df_save = df
+        if write_csv:
+            csv_path = f'{base_filename}.csv'
+            df_save = df.copy()
+        
+            # Convert lists to strings for CSV compatibility with C-level
+            # joins instead of per-row apply lambdas
+            df_save['original_skills'] = (
+                df_save['original_skills']
+                .map(lambda x: x if isinstance(x, list) else [str(x)])
+                .str.join(', ')
+            )
+
+            experiences = df_save['original_work_experiences']
+            is_list = experiences.map(lambda x: isinstance(x, list))
+            experience_strings = (
+                experiences[is_list]
+                .explode()
+                .map(lambda exp: f"{exp.get('company', '')}: {exp.get('roleName', '')}" if isinstance(exp, dict) else None)
+                .dropna()
+                .groupby(level=0)
+                .agg('; '.join)
+                .reindex(df_save.index, fill_value='')
+            )
+            experience_strings[~is_list] = experiences[~is_list].astype(str)
+            df_save['original_work_experiences'] = experience_strings
+
+            # Tier codes travel as labels in the CSV so downstream readers
+            # (hiring insights, backend) see the baseline categories, not
+            # raw int8 codes; unbinned rows (-1) stay empty like pd.cut NaN
+            for col, labels in self.TIER_LABELS.items():
+                if col in df_save.columns:
+                    df_save[col] = df_save[col].map(labels)
+
+            df_save.to_csv(csv_path, index=False)
+            print(f"✅ Main dataset saved to {csv_path}")
+
+
         # Save summary
         summary = self.generate_summary_statistics(df)
         summary_path = f'{base_filename}_summary.json'
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(summary_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    summary,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ))
+        else:
+            with open(summary_path, 'w') as f:
+                json.dump(summary, f, indent=2, default=str)
         print(f"✅ Summary statistics saved to {summary_path}")
         
         return df_save, summary
 
+def _engineer_shard(records):
+    """Process-pool worker: engineer features for one shard of candidates"""
+    return ComprehensiveFeatureEngineer(records=records).engineer_all_features()
+
 def main():
     """Main execution function"""
     print("🚀 Starting Comprehensive Feature Engineering Pipeline...")
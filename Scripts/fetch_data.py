@@ -1,26 +1,25 @@
 import requests
-import json
+import orjson
+from pathlib import Path
+
+# Reused session enables connection keep-alive across fetches
+_session = requests.Session()
 
 def fetch_data_from_url(url):
     """
     Fetch data from the given URL and return the JSON content
     """
     try:
-        # Make a GET request to the URL
-        response = requests.get(url)
-        
-        # Check if the request was successful
-        response.raise_for_status()
-        
-        # Parse the JSON data
-        data = response.json()
-        
-        return data
-    
+        # Stream the response and parse the raw bytes with orjson,
+        # skipping the intermediate Unicode decode of response.json()
+        with _session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data: {e}")
         return None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Error parsing JSON: {e}")
         return None
 
@@ -34,11 +33,12 @@ def main():
     if data is not None:
         print("Data fetched successfully!")
         print("\nData preview:")
-        print(json.dumps(data, indent=2))
+        # Print a bounded preview instead of the whole payload
+        preview = data[:3] if isinstance(data, list) else dict(list(data.items())[:5])
+        print(orjson.dumps(preview, option=orjson.OPT_INDENT_2).decode())
         
         # You can also save the data to a local file
-        with open('form-submissions.json', 'w') as f:
-            json.dump(data, f, indent=2)
+        Path('form-submissions.json').write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         print("\nData saved to 'form-submissions.json'")
         
         # Print some basic info about the data
@@ -1,6 +1,11 @@
+import ast
+import heapq
+import os
 import pandas as pd
 import numpy as np
 import json
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from collections import Counter, defaultdict
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -8,10 +13,100 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional sparse matrices for the skill co-occurrence computations
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Optional orjson for fast report serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional pyarrow for the multithreaded CSV reader
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional numba kernel, used for the pair statistics when scipy is missing
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _greedy_select_kernel(salaries, budget, team_size):
+        """Greedy pick of affordable candidates in value order"""
+        selected = np.empty(team_size, np.int64)
+        remaining = budget
+        count = 0
+        for i in range(salaries.shape[0]):
+            if count >= team_size:
+                break
+            if salaries[i] <= remaining:
+                selected[count] = i
+                remaining -= salaries[i]
+                count += 1
+        return selected[:count]
+
+    @njit(cache=True)
+    def _pair_stats_kernel(indptr, indices, scores, n_skills):
+        """Pair co-occurrence counts and score sums in one CSR walk"""
+        counts = np.zeros((n_skills, n_skills), np.float64)
+        score_sums = np.zeros((n_skills, n_skills), np.float64)
+        for i in range(len(indptr) - 1):
+            start = indptr[i]
+            end = indptr[i + 1]
+            score = scores[i]
+            for a in range(start, end):
+                ia = indices[a]
+                for b in range(start, end):
+                    ib = indices[b]
+                    counts[ia, ib] += 1
+                    score_sums[ia, ib] += score
+        return counts, score_sums
+
 class HiringInsightsGenerator:
+    # Columns this generator actually reads; everything else is skipped at load
+    USED_COLUMNS = [
+        'name', 'country', 'timezone_group', 'submitted_at', 'original_skills',
+        'salary_full_time', 'overall_score', 'experience_level',
+        'highest_education_level', 'primary_skill_category', 'budget_category',
+        'total_skills', 'total_experiences', 'has_big_tech', 'has_senior_role',
+        'has_lead_role', 'has_cs_degree', 'has_top_school', 'is_full_stack'
+    ]
+
     def __init__(self, engineered_csv_path):
         """Initialize with your engineered candidates data"""
-        self.df = pd.read_csv(engineered_csv_path)
+        header = pd.read_csv(engineered_csv_path, nrows=0).columns
+        self.df = pd.read_csv(
+            engineered_csv_path,
+            usecols=[col for col in header if col in self.USED_COLUMNS],
+            engine='pyarrow' if PYARROW_AVAILABLE else 'c'
+        )
+        # Narrow the hot numeric columns up front — every downstream mask
+        # and aggregation then moves half (or less) the memory
+        self.df = self.df.astype({
+            'salary_full_time': 'float32', 'overall_score': 'float32',
+            'total_skills': 'int16', 'total_experiences': 'int16',
+            'has_senior_role': 'bool', 'has_big_tech': 'bool',
+            'is_full_stack': 'bool', 'has_cs_degree': 'bool',
+            'has_lead_role': 'bool'
+        })
+        # Low-cardinality string columns become categoricals: smaller in
+        # memory and groupby/equality work on the integer codes
+        for col in ('country', 'experience_level', 'primary_skill_category',
+                    'timezone_group', 'highest_education_level'):
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
         self.insights = {}
         
         # Enhanced skill categories from your data analysis
@@ -26,52 +121,281 @@ class HiringInsightsGenerator:
         
         # Big tech and unicorn companies from your data
         self.tier1_companies = [
-            'Google', 'Amazon', 'Microsoft', 'Apple', 'Meta', 'Netflix', 'Tesla', 'Uber', 
+            'Google', 'Amazon', 'Microsoft', 'Apple', 'Meta', 'Netflix', 'Tesla', 'Uber',
             'Airbnb', 'Spotify', 'PayPal', 'Oracle', 'IBM', 'Cisco', 'Twitter', 'Deloitte'
         ]
-        
+
+        # Cached numpy views shared across the analysis methods: skills are
+        # parsed once and the hot columns are pulled out of the DataFrame.
+        # Missing skill cells become '' up front so the parse loop takes
+        # its cheap empty-string exit instead of a per-row pd.isna check.
+        self.df['original_skills'] = self.df['original_skills'].fillna('')
+        self._skill_sets = np.array(
+            [frozenset(self.parse_skills(s)) for s in self.df['original_skills'].to_numpy()],
+            dtype=object
+        )
+        self._skill_counts = np.fromiter(
+            (len(s) for s in self._skill_sets), dtype=np.int32, count=len(self._skill_sets)
+        )
+        self._salary = self.df['salary_full_time'].to_numpy()
+        self._valid_salary = self._salary > 0
+        self._score = self.df['overall_score'].to_numpy()
+        # Row order by descending score, computed once; every top-k query
+        # then reduces to a boolean gather plus a head slice
+        self._score_order = np.argsort(-self._score, kind='stable')
+        self._country = self.df['country'].to_numpy()
+        self._exp_level = self.df.get(
+            'experience_level', pd.Series(['Unknown'] * len(self.df))
+        ).astype(object).fillna('Unknown').to_numpy()
+        # Country tallies feed several report sections; hash-count once
+        self._country_counts = self.df['country'].value_counts()
+        # Distinct-value counts used by several diversity metrics, each a
+        # single hash-table pass instead of one per consumer.
+        # dropna=False: len(unique()) counted NaN as a distinct value
+        self._n_unique = {col: self.df[col].nunique(dropna=False) for col in [
+            'country', 'timezone_group', 'primary_skill_category',
+            'highest_education_level'
+        ]}
+        # Submission dates parsed once; cache=True dedupes repeated strings
+        self._submitted_date = pd.to_datetime(
+            self.df['submitted_at'], errors='coerce', cache=True
+        )
+        # Hot filter columns as contiguous numpy arrays, so the team
+        # template masks are built without per-op pandas overhead
+        self._cols = {col: self.df[col].to_numpy() for col in [
+            'salary_full_time', 'overall_score', 'total_experiences',
+            'is_full_stack', 'has_senior_role', 'has_cs_degree',
+            'has_big_tech', 'has_lead_role', 'primary_skill_category'
+        ]}
+
+    def _skill_matrix(self, skills):
+        """Candidate × skill indicator matrix over the given skill list
+
+        Returns a scipy CSR matrix when scipy is available, otherwise a
+        dense numpy array; both support the same matmul/slicing usage.
+        """
+        skill_to_idx = {skill: i for i, skill in enumerate(skills)}
+        rows, cols = [], []
+        for row, skill_set in enumerate(self._skill_sets):
+            for skill in skill_set:
+                idx = skill_to_idx.get(skill)
+                if idx is not None:
+                    rows.append(row)
+                    cols.append(idx)
+
+        shape = (len(self._skill_sets), len(skills))
+        if SCIPY_AVAILABLE:
+            return sparse.csr_matrix(
+                (np.ones(len(rows)), (rows, cols)), shape=shape
+            )
+        matrix = np.zeros(shape)
+        matrix[rows, cols] = 1.0
+        return matrix
+
+    def _full_skill_matrix(self):
+        """Candidate × skill matrix over every observed skill, built once
+
+        Returns (matrix, skill_names) where skill_names[j] is the skill
+        behind column j.
+        """
+        if not hasattr(self, '_full_matrix'):
+            all_skills = sorted({skill for skill_set in self._skill_sets for skill in skill_set})
+            self._full_matrix = (self._skill_matrix(all_skills), np.array(all_skills, dtype=object))
+        return self._full_matrix
+
+    def _top_by_score(self, mask, n, frame=None):
+        """Top-n rows under a numpy boolean mask, ordered by score
+
+        Walks the precomputed descending-score order so each query costs
+        one boolean gather instead of a fresh sort; only the n-row result
+        is materialized as a DataFrame. Pass a narrow `frame` to avoid
+        slicing the full-width DataFrame.
+        """
+        if frame is None:
+            frame = self.df
+        order = self._score_order
+        return frame.iloc[order[mask[order]][:n]]
+
+    def _category_coverage(self):
+        """Per-candidate boolean coverage of each critical skill category
+
+        One matmul of the candidate × skill matrix against a skill ×
+        category membership matrix replaces the nested category/skill/row
+        loops. Returns (category_names, coverage) with coverage of shape
+        (n_candidates, n_categories).
+        """
+        if not hasattr(self, '_coverage'):
+            matrix, skill_names = self._full_skill_matrix()
+            categories = list(self.critical_skills.keys())
+            skill_to_idx = {skill: i for i, skill in enumerate(skill_names)}
+            rows, cols = [], []
+            for col, category in enumerate(categories):
+                for skill in self.critical_skills[category]:
+                    idx = skill_to_idx.get(skill)
+                    if idx is not None:
+                        rows.append(idx)
+                        cols.append(col)
+
+            shape = (len(skill_names), len(categories))
+            if SCIPY_AVAILABLE:
+                membership = sparse.csc_matrix((np.ones(len(rows)), (rows, cols)), shape=shape)
+            else:
+                membership = np.zeros(shape)
+                membership[rows, cols] = 1.0
+            self._coverage = (categories, self._as_array(matrix @ membership) > 0)
+        return self._coverage
+
+    def _shared_masks(self):
+        """Recurring candidate filters, built together in one pass
+
+        Several report sections re-derive the same score/salary cuts;
+        computing them side by side streams the cached arrays through
+        cache once and lets every consumer reuse the bool arrays.
+        """
+        if not hasattr(self, '_masks'):
+            score, salary = self._score, self._salary
+            self._masks = {
+                'high_value_100k': (score >= 80) & (salary <= 100000),
+                'high_value_80k': (score >= 80) & (salary <= 80000),
+                'bargain': np.logical_and.reduce(
+                    [score >= 75, salary <= 60000, self._valid_salary]
+                ),
+                'core_full_stack': np.logical_and.reduce(
+                    [score >= 80, salary <= 90000, self._cols['is_full_stack']]
+                ),
+            }
+        return self._masks
+
+    def _country_summary(self):
+        """Per-country score/salary/count aggregate, computed once
+
+        Shared by the geographic opportunity and budget tactic analyses,
+        which previously each ran the identical groupby. Kept unrounded;
+        callers round the handful of values they actually emit.
+        """
+        if not hasattr(self, '_country_stats'):
+            self._country_stats = self.df.groupby('country', sort=False, observed=True).agg({
+                'overall_score': 'mean',
+                'salary_full_time': 'mean',
+                'name': 'count'
+            })
+        return self._country_stats
+
+    def _salary_order(self):
+        """Ascending salary order, computed once
+
+        generate_budget_strategies probes several budgets; each probe then
+        locates its affordability window with two binary searches instead
+        of a fresh boolean scan over the whole salary column.
+        """
+        if not hasattr(self, '_sal_sorted_idx'):
+            self._sal_sorted_idx = np.argsort(self._salary, kind='stable')
+            self._sal_sorted = self._salary[self._sal_sorted_idx]
+        return self._sal_sorted_idx, self._sal_sorted
+
+    def _pair_stats(self, matrix, scores):
+        """Pair co-occurrence counts and per-pair score sums
+
+        With scipy installed these are two CSR matmuls. Without scipy,
+        the numba kernel (when available) walks a CSR-like layout of the
+        dense fallback matrix in one pass, avoiding the K×K dense
+        products entirely.
+        """
+        if SCIPY_AVAILABLE or not NUMBA_AVAILABLE:
+            counts = self._as_array(matrix.T @ matrix)
+            score_sums = self._as_array(matrix.T @ self._scale_rows(matrix, scores))
+            return counts, score_sums
+
+        indptr = np.zeros(matrix.shape[0] + 1, np.int64)
+        np.cumsum((matrix > 0).sum(axis=1), out=indptr[1:])
+        indices = np.nonzero(matrix)[1].astype(np.int64)
+        return _pair_stats_kernel(indptr, indices, scores.astype(np.float64), matrix.shape[1])
+
+    @staticmethod
+    def _top_k_items(entries, metric, k):
+        """Top-k entries of a dict by metric, via O(n) selection
+
+        argpartition picks the k winners without sorting the whole dict;
+        only those k are then sorted for stable emission order.
+        """
+        keys = list(entries.keys())
+        vals = np.fromiter((metric(entries[key]) for key in keys), dtype=float, count=len(keys))
+        top = np.argpartition(-vals, k)[:k] if len(keys) > k else np.arange(len(keys))
+        top = top[np.argsort(-vals[top])]
+        return {keys[i]: entries[keys[i]] for i in top}
+
+    @staticmethod
+    def _present_counts(series):
+        """value_counts with zero-count levels dropped
+
+        On a subset of a categorical column, value_counts reports every
+        dictionary level; only the levels actually present in the subset
+        belong in the report.
+        """
+        counts = series.value_counts()
+        return counts[counts > 0]
+
+    @staticmethod
+    def _records(frame, cols):
+        """List of per-row dicts for the given columns
+
+        Builds the dicts straight from the numpy block, skipping the
+        generic to_dict('records') conversion path.
+        """
+        return [dict(zip(cols, row)) for row in frame[cols].to_numpy()]
+
+    @staticmethod
+    def _as_array(matrix):
+        """Densify a sparse (or pass through a dense) matrix product"""
+        return matrix.toarray() if hasattr(matrix, 'toarray') else np.asarray(matrix)
+
+    @staticmethod
+    def _scale_rows(matrix, weights):
+        """Multiply each candidate row by a per-candidate weight"""
+        if hasattr(matrix, 'multiply'):
+            return matrix.multiply(weights[:, None]).tocsr()
+        return matrix * weights[:, None]
+
     def parse_skills(self, skills_str):
         """Safely parse skills from CSV string format"""
-        if pd.isna(skills_str) or not skills_str or skills_str == '[]':
+        # Empty/placeholder strings short-circuit before the (slower)
+        # pd.isna check, which only non-string cells still need
+        if not skills_str or skills_str == '[]':
+            return []
+        if not isinstance(skills_str, str) and pd.isna(skills_str):
             return []
         
         # If it's already a string with commas, split it
         if isinstance(skills_str, str):
-            # Try to eval first (for list format)
-            try:
-                if skills_str.startswith('[') and skills_str.endswith(']'):
-                    return eval(skills_str)
-            except:
-                pass
-            
+            # Parse list-formatted cells as literals — no eval, so there is
+            # no per-row compile step (and no code execution hazard)
+            if skills_str.startswith('[') and skills_str.endswith(']'):
+                try:
+                    return json.loads(skills_str.replace("'", '"'))
+                except (ValueError, TypeError):
+                    pass
+                try:
+                    return ast.literal_eval(skills_str)
+                except (ValueError, SyntaxError):
+                    pass
+
             # Split by comma and clean
             skills = [skill.strip() for skill in skills_str.split(',') if skill.strip()]
             return skills
-        
+
         return []
         
     def generate_market_intelligence(self):
         """Enhanced market intelligence insights"""
         insights = {}
         
-        # Salary vs Skills Analysis
-        skill_salary_correlation = []
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            if skills and row['salary_full_time'] > 0:
-                skill_salary_correlation.append({
-                    'skills_count': len(skills),
-                    'salary': row['salary_full_time'],
-                    'overall_score': row['overall_score'],
-                    'country': row['country'],
-                    'experience_level': row.get('experience_level', 'Unknown')
-                })
-        
-        skill_salary_df = pd.DataFrame(skill_salary_correlation)
-        
+        # Salary vs Skills Analysis — one Pearson correlation over the
+        # cached arrays, no intermediate record list or DataFrame
+        valid = (self._skill_counts > 0) & self._valid_salary
+
         insights['market_intelligence'] = {
-            'salary_skill_correlation': skill_salary_df['skills_count'].corr(skill_salary_df['salary']) if len(skill_salary_df) > 0 else 0,
-            'high_value_candidates': len(self.df[(self.df['overall_score'] >= 80) & (self.df['salary_full_time'] <= 80000)]),
+            'salary_skill_correlation': np.corrcoef(self._skill_counts[valid], self._salary[valid])[0, 1] if valid.any() else 0,
+            'high_value_candidates': int(self._shared_masks()['high_value_80k'].sum()),
             'geographic_arbitrage_opportunities': self.analyze_geographic_arbitrage(),
             'skill_premium_analysis': self.analyze_skill_premiums(),
             'salary_inflation_analysis': self.analyze_salary_inflation(),
@@ -82,13 +406,13 @@ class HiringInsightsGenerator:
     
     def analyze_geographic_arbitrage(self):
         """Enhanced geographic arbitrage with cost of living adjustments"""
-        country_stats = self.df.groupby('country').agg({
+        country_stats = self.df.groupby('country', observed=True).agg({
             'salary_full_time': ['mean', 'median', 'count'],
             'overall_score': 'mean',
             'total_skills': 'mean',
             'has_senior_role': 'sum',
             'has_big_tech': 'sum'
-        }).round(2)
+        })
         
         # Flatten column names
         country_stats.columns = ['avg_salary', 'median_salary', 'candidate_count', 'avg_score', 'avg_skills', 'senior_count', 'big_tech_count']
@@ -109,101 +433,84 @@ class HiringInsightsGenerator:
             country_stats['big_tech_count'] * 0.3
         )
         
-        # Convert to regular dict with string keys
-        result_dict = {}
-        for col in country_stats.columns:
-            result_dict[col] = {}
-            for country in country_stats.index:
-                result_dict[col][str(country)] = country_stats.loc[country, col]
-        
-        return result_dict
+        # Convert to regular dict with string keys in one C-level pass,
+        # rounding only the small filtered frame that gets emitted
+        country_stats.index = country_stats.index.astype(str)
+        return country_stats.round(2).to_dict()
     
     def analyze_skill_premiums(self):
         """Enhanced skill premium analysis with market context"""
         skill_premiums = {}
-        
-        # Get all unique skills
-        all_skills = set()
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            all_skills.update(skills)
-        
+
+        # The skill universe is already enumerated by the shared matrix,
+        # and its columns answer the per-skill membership queries below
+        matrix, skill_names = self._full_skill_matrix()
+        all_skills = set(skill_names)
+        skill_column = {skill: i for i, skill in enumerate(skill_names)}
+
         # Focus on high-impact skills
         priority_skills = []
         for category_skills in self.critical_skills.values():
             priority_skills.extend(category_skills)
-        
+
         # Calculate premiums for priority skills first
         skills_to_analyze = list(set(priority_skills) & all_skills) + list(all_skills - set(priority_skills))[:30]
-        
+
+        # One matrix column per skill instead of a Python membership test
+        # per row
         for skill in skills_to_analyze:
-            candidates_with_skill = []
-            candidates_without_skill = []
-            experience_levels_with = []
-            countries_with = []
-            
-            for idx, row in self.df.iterrows():
-                if row['salary_full_time'] > 0:
-                    skills = self.parse_skills(row.get('original_skills', ''))
-                    if skill in skills:
-                        candidates_with_skill.append(row['salary_full_time'])
-                        experience_levels_with.append(row.get('experience_level', 'Unknown'))
-                        countries_with.append(row['country'])
-                    else:
-                        candidates_without_skill.append(row['salary_full_time'])
-            
-            if len(candidates_with_skill) >= 3:  # Minimum sample size
-                avg_with = np.mean(candidates_with_skill)
-                avg_without = np.mean(candidates_without_skill) if candidates_without_skill else avg_with
+            has_skill = self._as_array(matrix[:, skill_column[skill]]).ravel().astype(bool)
+            with_mask = has_skill & self._valid_salary
+            without_mask = self._valid_salary & ~has_skill
+            candidate_count = int(with_mask.sum())
+
+            if candidate_count >= 3:  # Minimum sample size
+                avg_with = self._salary[with_mask].mean()
+                avg_without = self._salary[without_mask].mean() if without_mask.any() else avg_with
                 premium = ((avg_with - avg_without) / avg_without * 100) if avg_without > 0 else 0
-                
+
                 # Determine skill category
                 skill_category = 'other'
                 for category, skills_list in self.critical_skills.items():
                     if skill in skills_list:
                         skill_category = category
                         break
-                
+
                 skill_premiums[skill] = {
                     'salary_with_skill': round(avg_with, 2),
                     'salary_without_skill': round(avg_without, 2),
                     'premium_percentage': round(premium, 2),
-                    'candidate_count': len(candidates_with_skill),
+                    'candidate_count': candidate_count,
                     'skill_category': skill_category,
-                    'market_demand': 'high' if len(candidates_with_skill) >= 20 else 'medium' if len(candidates_with_skill) >= 10 else 'low',
-                    'top_countries': Counter(countries_with).most_common(3),
-                    'experience_distribution': Counter(experience_levels_with)
+                    'market_demand': 'high' if candidate_count >= 20 else 'medium' if candidate_count >= 10 else 'low',
+                    'top_countries': Counter(self._country[with_mask].tolist()).most_common(3),
+                    'experience_distribution': Counter(self._exp_level[with_mask].tolist())
                 }
         
-        # Sort by premium percentage
-        sorted_premiums = dict(sorted(skill_premiums.items(), key=lambda x: x[1]['premium_percentage'], reverse=True))
-        return dict(list(sorted_premiums.items())[:25])  # Top 25 skills
+        # Top 25 skills by premium percentage
+        return self._top_k_items(skill_premiums, lambda v: v['premium_percentage'], 25)
     
     def analyze_salary_inflation(self):
         """Analyze salary trends and inflation patterns"""
         salary_analysis = {}
-        
-        # Parse submission dates to analyze trends
-        self.df['submitted_date'] = pd.to_datetime(self.df['submitted_at'], errors='coerce')
-        
-        # Group by experience level
+
+        # Group by experience level — each cohort is one contiguous numpy
+        # slice of the cached salary array rather than repeated frame scans
         for exp_level in ['Entry-Level', 'Junior', 'Mid-Level', 'Senior']:
-            level_data = self.df[
-                (self.df.get('experience_level', '') == exp_level) & 
-                (self.df['salary_full_time'] > 0)
-            ]
-            
-            if len(level_data) > 5:
+            salaries = self._salary[(self._exp_level == exp_level) & self._valid_salary]
+
+            if len(salaries) > 5:
+                q1, q3 = np.quantile(salaries, [0.25, 0.75])
                 salary_analysis[exp_level] = {
-                    'avg_salary': round(level_data['salary_full_time'].mean(), 2),
-                    'median_salary': round(level_data['salary_full_time'].median(), 2),
+                    'avg_salary': round(salaries.mean(), 2),
+                    'median_salary': round(np.median(salaries), 2),
                     'salary_range': {
-                        'min': round(level_data['salary_full_time'].min(), 2),
-                        'max': round(level_data['salary_full_time'].max(), 2),
-                        'q1': round(level_data['salary_full_time'].quantile(0.25), 2),
-                        'q3': round(level_data['salary_full_time'].quantile(0.75), 2)
+                        'min': round(salaries.min(), 2),
+                        'max': round(salaries.max(), 2),
+                        'q1': round(q1, 2),
+                        'q3': round(q3, 2)
                     },
-                    'candidate_count': len(level_data)
+                    'candidate_count': len(salaries)
                 }
         
         return salary_analysis
@@ -211,35 +518,32 @@ class HiringInsightsGenerator:
     def analyze_market_saturation(self):
         """Analyze market saturation for different skill combinations"""
         saturation_analysis = {}
-        
-        # Analyze popular skill combinations
-        skill_combinations = defaultdict(int)
-        
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            if len(skills) >= 2:
-                # Get most common 2-skill combinations
-                for i, skill1 in enumerate(skills):
-                    for skill2 in skills[i+1:]:
-                        combo = tuple(sorted([skill1, skill2]))
-                        skill_combinations[combo] += 1
-        
-        # Analyze top combinations
-        for combo, count in Counter(skill_combinations).most_common(15):
+
+        # Pair occurrence counts and score sums for every observed skill
+        # combination come from two matrix products over the shared
+        # candidate × skill matrix
+        matrix, skill_names = self._full_skill_matrix()
+        pair_counts, pair_score_sums = self._pair_stats(matrix, self._score)
+
+        # Analyze top combinations (upper triangle only, so each pair is
+        # counted once)
+        counts = np.triu(pair_counts, k=1)
+        flat = counts.ravel()
+        top = np.argpartition(-flat, min(15, flat.size - 1))[:15]
+        top = top[np.argsort(-flat[top])]
+        for flat_idx in top:
+            count = int(flat[flat_idx])
             if count >= 5:
-                # Calculate average score for this combination
-                combo_candidates = []
-                for idx, row in self.df.iterrows():
-                    skills = self.parse_skills(row.get('original_skills', ''))
-                    if all(skill in skills for skill in combo):
-                        combo_candidates.append(row['overall_score'])
-                
+                i, j = np.unravel_index(flat_idx, counts.shape)
+                combo = tuple(sorted([skill_names[i], skill_names[j]]))
+                avg_score = pair_score_sums[i, j] / count
+
                 saturation_analysis[f"{combo[0]} + {combo[1]}"] = {
                     'candidate_count': count,
-                    'avg_score': round(np.mean(combo_candidates), 2) if combo_candidates else 0,
+                    'avg_score': round(avg_score, 2),
                     'saturation_level': 'high' if count >= 20 else 'medium' if count >= 10 else 'low'
                 }
-        
+
         return saturation_analysis
     
     def generate_team_composition_insights(self):
@@ -248,11 +552,11 @@ class HiringInsightsGenerator:
         
         # Enhanced diversity analysis
         insights['diversity_metrics'] = {
-            'geographic_diversity': len(self.df['country'].unique()),
-            'skill_category_diversity': len(self.df['primary_skill_category'].unique()),
+            'geographic_diversity': self._n_unique['country'],
+            'skill_category_diversity': self._n_unique['primary_skill_category'],
             'experience_level_distribution': self.df.get('experience_level', pd.Series()).value_counts().to_dict(),
             'salary_range_distribution': self.df.get('budget_category', pd.Series()).value_counts().to_dict(),
-            'timezone_diversity': len(self.df['timezone_group'].unique()),
+            'timezone_diversity': self._n_unique['timezone_group'],
             'education_diversity': self.df['highest_education_level'].value_counts().to_dict()
         }
         
@@ -269,97 +573,111 @@ class HiringInsightsGenerator:
     
     def analyze_skill_complementarity(self):
         """Enhanced skill complementarity analysis"""
-        skill_combinations = defaultdict(list)
-        
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            if skills and row['overall_score'] >= 70 and len(skills) >= 3:
-                # Create skill pairs from different categories
-                categorized_skills = {category: [] for category in self.critical_skills.keys()}
-                
-                for skill in skills:
-                    for category, category_skills in self.critical_skills.items():
-                        if skill in category_skills:
-                            categorized_skills[category].append(skill)
-                
-                # Cross-category combinations are more valuable
-                for cat1, skills1 in categorized_skills.items():
-                    for cat2, skills2 in categorized_skills.items():
-                        if cat1 != cat2 and skills1 and skills2:
-                            for skill1 in skills1:
-                                for skill2 in skills2:
-                                    pair = tuple(sorted([skill1, skill2]))
-                                    skill_combinations[pair].append({
-                                        'score': row['overall_score'],
-                                        'salary': row['salary_full_time'],
-                                        'country': row['country']
-                                    })
-        
-        # Find most effective combinations
+        critical_skill_list = [skill for skills in self.critical_skills.values() for skill in skills]
+        skill_categories = np.array([
+            category for category, skills in self.critical_skills.items() for _ in skills
+        ])
+
+        eligible = (self._score >= 70) & (self._skill_counts >= 3)
+        matrix = self._skill_matrix(critical_skill_list)[eligible]
+        scores = self._score[eligible]
+        salaries = self._salary[eligible]
+        countries = self._country[eligible]
+        valid_salary = salaries > 0
+
+        # Pair-wise candidate counts and score/salary sums come from a few
+        # matmuls over the candidate × skill matrix instead of per-row
+        # Python pair enumeration
+        pair_counts, score_sums = self._pair_stats(matrix, scores)
+        _, score_square_sums = self._pair_stats(matrix, scores ** 2)
+        salary_counts, salary_sums = self._pair_stats(matrix[valid_salary], salaries[valid_salary])
+
+        # Number of distinct countries where each pair co-occurs
+        geographic_spread = np.zeros_like(pair_counts)
+        for country in pd.unique(countries):
+            country_matrix = matrix[countries == country]
+            geographic_spread += self._as_array(country_matrix.T @ country_matrix) > 0
+
+        # Find most effective cross-category combinations
         effective_combinations = {}
-        for pair, candidates in skill_combinations.items():
-            if len(candidates) >= 3:
-                scores = [c['score'] for c in candidates]
-                salaries = [c['salary'] for c in candidates if c['salary'] > 0]
-                countries = [c['country'] for c in candidates]
-                
-                effective_combinations[f"{pair[0]} + {pair[1]}"] = {
-                    'avg_score': round(np.mean(scores), 2),
-                    'frequency': len(candidates),
-                    'score_variance': round(np.std(scores), 2),
-                    'avg_salary': round(np.mean(salaries), 2) if salaries else 0,
-                    'geographic_spread': len(set(countries)),
-                    'value_rating': round(np.mean(scores) / (np.mean(salaries) / 1000), 2) if salaries else 0
-                }
-        
-        # Sort by value rating (score per salary unit)
-        sorted_combinations = dict(sorted(effective_combinations.items(), key=lambda x: x[1]['value_rating'], reverse=True))
-        return dict(list(sorted_combinations.items())[:20])
+        for i, j in zip(*np.nonzero(np.triu(pair_counts, k=1))):
+            count = int(pair_counts[i, j])
+            if count < 3 or skill_categories[i] == skill_categories[j]:
+                continue
+
+            avg_score = score_sums[i, j] / count
+            score_std = np.sqrt(max(score_square_sums[i, j] / count - avg_score ** 2, 0))
+            salary_count = int(salary_counts[i, j])
+            avg_salary = salary_sums[i, j] / salary_count if salary_count else 0
+            pair = tuple(sorted([critical_skill_list[i], critical_skill_list[j]]))
+
+            effective_combinations[f"{pair[0]} + {pair[1]}"] = {
+                'avg_score': round(avg_score, 2),
+                'frequency': count,
+                'score_variance': round(score_std, 2),
+                'avg_salary': round(avg_salary, 2) if salary_count else 0,
+                'geographic_spread': int(geographic_spread[i, j]),
+                'value_rating': round(avg_score / (avg_salary / 1000), 2) if salary_count else 0
+            }
+
+        # Top 20 by value rating (score per salary unit)
+        return self._top_k_items(effective_combinations, lambda v: v['value_rating'], 20)
     
     def generate_enhanced_team_templates(self):
         """Generate enhanced team composition templates"""
         templates = {}
-        
+        cols = self._cols
+
+        # All templates emit the same few columns, so slice the wide
+        # DataFrame down to them once and filter the narrow frame
+        base = self.df[['name', 'overall_score', 'salary_full_time', 'country', 'timezone_group']]
+
         # Startup MVP Team (scrappy, full-stack, budget-conscious)
         startup_criteria = (
-            (self.df['salary_full_time'] <= 75000) & 
-            (self.df['overall_score'] >= 65) & 
-            (self.df['is_full_stack'] == True)
+            (cols['salary_full_time'] <= 75000) &
+            (cols['overall_score'] >= 65) &
+            (cols['is_full_stack'] == True)
         )
-        startup_candidates = self.df[startup_criteria].nlargest(20, 'overall_score')
-        
+        startup_candidates = self._top_by_score(startup_criteria, 20, base)
+
         # Scale-up Team (proven experience, balanced skills)
         scaleup_criteria = (
-            (self.df['total_experiences'] >= 2) & 
-            (self.df['overall_score'] >= 70) &
-            (self.df['salary_full_time'] <= 120000)
+            (cols['total_experiences'] >= 2) &
+            (cols['overall_score'] >= 70) &
+            (cols['salary_full_time'] <= 120000)
         )
-        scaleup_candidates = self.df[scaleup_criteria].nlargest(20, 'overall_score')
-        
+        scaleup_candidates = self._top_by_score(scaleup_criteria, 20, base)
+
         # Enterprise Team (senior roles, diverse backgrounds)
         enterprise_criteria = (
-            (self.df['has_senior_role'] == True) & 
-            (self.df['total_experiences'] >= 3) & 
-            (self.df['overall_score'] >= 75)
+            (cols['has_senior_role'] == True) &
+            (cols['total_experiences'] >= 3) &
+            (cols['overall_score'] >= 75)
         )
-        enterprise_candidates = self.df[enterprise_criteria].nlargest(20, 'overall_score')
-        
+        enterprise_candidates = self._top_by_score(enterprise_criteria, 20, base)
+
         # AI/Data Team (cutting-edge, research-focused)
         ai_criteria = (
-            (self.df['primary_skill_category'].isin(['data', 'languages'])) & 
-            (self.df['has_cs_degree'] == True) & 
-            (self.df['overall_score'] >= 70)
+            np.isin(cols['primary_skill_category'], ['data', 'languages']) &
+            (cols['has_cs_degree'] == True) &
+            (cols['overall_score'] >= 70)
         )
-        ai_candidates = self.df[ai_criteria].nlargest(20, 'overall_score')
-        
+        ai_candidates = self._top_by_score(ai_criteria, 20, base)
+
         # Remote-First Global Team (timezone diversity, communication skills)
         remote_criteria = (
-            (self.df['overall_score'] >= 65) &
-            (self.df['salary_full_time'] <= 100000)
+            (cols['overall_score'] >= 65) &
+            (cols['salary_full_time'] <= 100000)
+        )
+        # Top 3 per timezone group via one sort + groupby-head, avoiding the
+        # per-group Python callback of groupby().apply(nlargest)
+        remote_candidates = (
+            base[remote_criteria]
+            .sort_values('overall_score', ascending=False)
+            .groupby('timezone_group', sort=False, observed=True)
+            .head(3)
+            .reset_index(drop=True)
         )
-        remote_candidates = self.df[remote_criteria].groupby('timezone_group').apply(
-            lambda x: x.nlargest(3, 'overall_score')
-        ).reset_index(drop=True)
         
         templates = {
             'startup_mvp': {
@@ -368,7 +686,7 @@ class HiringInsightsGenerator:
                 'avg_salary': startup_candidates['salary_full_time'].mean() if len(startup_candidates) > 0 else 0,
                 'avg_score': startup_candidates['overall_score'].mean() if len(startup_candidates) > 0 else 0,
                 'key_traits': ['full-stack', 'budget-conscious', 'high-potential'],
-                'top_candidates': startup_candidates[['name', 'overall_score', 'salary_full_time', 'country']].head(5).to_dict('records') if len(startup_candidates) > 0 else []
+                'top_candidates': self._records(startup_candidates.head(5), ['name', 'overall_score', 'salary_full_time', 'country'])
             },
             'scale_up': {
                 'description': 'Balanced team for scaling existing product',
@@ -376,7 +694,7 @@ class HiringInsightsGenerator:
                 'avg_salary': scaleup_candidates['salary_full_time'].mean() if len(scaleup_candidates) > 0 else 0,
                 'avg_score': scaleup_candidates['overall_score'].mean() if len(scaleup_candidates) > 0 else 0,
                 'key_traits': ['proven-experience', 'balanced-skills', 'growth-ready'],
-                'top_candidates': scaleup_candidates[['name', 'overall_score', 'salary_full_time', 'country']].head(5).to_dict('records') if len(scaleup_candidates) > 0 else []
+                'top_candidates': self._records(scaleup_candidates.head(5), ['name', 'overall_score', 'salary_full_time', 'country'])
             },
             'enterprise': {
                 'description': 'Senior team for complex enterprise solutions',
@@ -384,7 +702,7 @@ class HiringInsightsGenerator:
                 'avg_salary': enterprise_candidates['salary_full_time'].mean() if len(enterprise_candidates) > 0 else 0,
                 'avg_score': enterprise_candidates['overall_score'].mean() if len(enterprise_candidates) > 0 else 0,
                 'key_traits': ['senior-experience', 'enterprise-ready', 'leadership'],
-                'top_candidates': enterprise_candidates[['name', 'overall_score', 'salary_full_time', 'country']].head(5).to_dict('records') if len(enterprise_candidates) > 0 else []
+                'top_candidates': self._records(enterprise_candidates.head(5), ['name', 'overall_score', 'salary_full_time', 'country'])
             },
             'ai_innovation': {
                 'description': 'AI/ML focused team for cutting-edge development',
@@ -392,7 +710,7 @@ class HiringInsightsGenerator:
                 'avg_salary': ai_candidates['salary_full_time'].mean() if len(ai_candidates) > 0 else 0,
                 'avg_score': ai_candidates['overall_score'].mean() if len(ai_candidates) > 0 else 0,
                 'key_traits': ['ai-ml-expertise', 'research-background', 'innovation-focused'],
-                'top_candidates': ai_candidates[['name', 'overall_score', 'salary_full_time', 'country']].head(5).to_dict('records') if len(ai_candidates) > 0 else []
+                'top_candidates': self._records(ai_candidates.head(5), ['name', 'overall_score', 'salary_full_time', 'country'])
             },
             'remote_global': {
                 'description': 'Timezone-distributed remote team',
@@ -400,8 +718,8 @@ class HiringInsightsGenerator:
                 'avg_salary': remote_candidates['salary_full_time'].mean() if len(remote_candidates) > 0 else 0,
                 'avg_score': remote_candidates['overall_score'].mean() if len(remote_candidates) > 0 else 0,
                 'key_traits': ['remote-ready', 'timezone-diversity', 'communication-skills'],
-                'timezone_coverage': remote_candidates['timezone_group'].value_counts().to_dict() if len(remote_candidates) > 0 else {},
-                'top_candidates': remote_candidates[['name', 'overall_score', 'salary_full_time', 'country', 'timezone_group']].head(6).to_dict('records') if len(remote_candidates) > 0 else []
+                'timezone_coverage': self._present_counts(remote_candidates['timezone_group']).to_dict() if len(remote_candidates) > 0 else {},
+                'top_candidates': self._records(remote_candidates.head(6), ['name', 'overall_score', 'salary_full_time', 'country', 'timezone_group'])
             }
         }
         
@@ -409,20 +727,20 @@ class HiringInsightsGenerator:
     
     def calculate_skill_overlap(self):
         """Calculate healthy skill overlap vs specialization"""
-        skill_freq = Counter()
-        
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            skill_freq.update(skills)
-        
-        total_skills = len(skill_freq)
-        common_skills = len([skill for skill, count in skill_freq.items() if count >= 10])
-        
+        # One column sum over the shared matrix gives every skill frequency
+        matrix, skill_names = self._full_skill_matrix()
+        skill_freq = np.asarray(matrix.sum(axis=0)).ravel()
+
+        total_skills = int((skill_freq > 0).sum())
+        common_skills = int((skill_freq >= 10).sum())
+        top = np.argpartition(-skill_freq, min(10, skill_freq.size - 1))[:10] if skill_freq.size else []
+        top = top[np.argsort(-skill_freq[top])] if len(top) else top
+
         return {
             'total_unique_skills': total_skills,
             'common_skills_count': common_skills,
             'specialization_ratio': (total_skills - common_skills) / total_skills if total_skills > 0 else 0,
-            'most_common_skills': dict(skill_freq.most_common(10))
+            'most_common_skills': {skill_names[i]: int(skill_freq[i]) for i in top}
         }
     
     def analyze_team_chemistry(self):
@@ -431,17 +749,17 @@ class HiringInsightsGenerator:
         
         # Education background compatibility
         try:
-            edu_combinations = self.df.groupby(['highest_education_level', 'has_cs_degree']).agg({
+            edu_combinations = self.df.groupby(['highest_education_level', 'has_cs_degree'], observed=True).agg({
                 'overall_score': 'mean',
                 'name': 'count'
-            }).round(2)
-            
-            # Convert multi-index to string keys
+            })
+
+            # Convert multi-index to string keys, rounding at emission
             edu_dict = {}
             for (level, has_cs), row in edu_combinations.iterrows():
                 key = f"{level}_CS_{has_cs}"
                 edu_dict[key] = {
-                    'overall_score': row['overall_score'],
+                    'overall_score': round(row['overall_score'], 2),
                     'count': row['name']
                 }
             chemistry_analysis['education_compatibility'] = edu_dict
@@ -450,7 +768,7 @@ class HiringInsightsGenerator:
         
         # Experience level balance analysis
         try:
-            exp_balance = self.df.groupby('experience_level').agg({
+            exp_balance = self.df.groupby('experience_level', observed=True).agg({
                 'overall_score': 'mean',
                 'salary_full_time': 'mean',
                 'name': 'count'
@@ -459,7 +777,7 @@ class HiringInsightsGenerator:
         except:
             chemistry_analysis['experience_balance'] = {}
         
-        chemistry_analysis['cultural_diversity_score'] = len(self.df['country'].unique()) / len(self.df) * 100
+        chemistry_analysis['cultural_diversity_score'] = self._n_unique['country'] / len(self.df) * 100
         chemistry_analysis['skill_overlap_analysis'] = self.calculate_skill_overlap()
         
         return chemistry_analysis
@@ -488,47 +806,44 @@ class HiringInsightsGenerator:
     def analyze_talent_scarcity(self):
         """Analyze scarcity of different skill combinations"""
         scarcity_analysis = {}
-        
-        # High-demand, low-supply skills
-        skill_demand = Counter()
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            skill_demand.update(skills)
-        
-        # Calculate scarcity score (demand vs quality candidates)
-        for skill, count in skill_demand.most_common(30):
-            quality_candidates = 0
-            for idx, row in self.df.iterrows():
-                if row['overall_score'] >= 80:
-                    skills = self.parse_skills(row.get('original_skills', ''))
-                    if skill in skills:
-                        quality_candidates += 1
-            
+
+        # Demand and quality supply are two column sums over the shared
+        # candidate × skill matrix
+        matrix, skill_names = self._full_skill_matrix()
+        demand = np.asarray(matrix.sum(axis=0)).ravel()
+        quality = np.asarray(matrix[self._score >= 80].sum(axis=0)).ravel()
+
+        # Calculate scarcity score (demand vs quality candidates) for the
+        # 30 most demanded skills
+        top_idx = np.argpartition(-demand, min(30, demand.size - 1))[:30]
+        top_idx = top_idx[np.argsort(-demand[top_idx])]
+        for idx in top_idx:
+            count = int(demand[idx])
+            quality_candidates = int(quality[idx])
             scarcity_score = count / max(quality_candidates, 1)
-            scarcity_analysis[skill] = {
+            scarcity_analysis[skill_names[idx]] = {
                 'total_candidates': count,
                 'quality_candidates': quality_candidates,
                 'scarcity_score': round(scarcity_score, 2)
             }
         
-        # Sort by scarcity (high demand, low quality supply)
-        sorted_scarcity = dict(sorted(scarcity_analysis.items(), key=lambda x: x[1]['scarcity_score'], reverse=True))
-        return dict(list(sorted_scarcity.items())[:15])
+        # Top 15 by scarcity (high demand, low quality supply)
+        return self._top_k_items(scarcity_analysis, lambda v: v['scarcity_score'], 15)
     
     def analyze_competition_indicators(self):
         """Analyze indicators of candidate competitiveness"""
         competition_indicators = {}
         
         # High-value candidates likely to have multiple offers
-        high_competition = self.df[
-            (self.df['overall_score'] >= 85) & 
-            (self.df['salary_full_time'] <= 100000) & 
-            (self.df['has_big_tech'] == True)
-        ]
-        
-        competition_indicators['high_competition_candidates'] = len(high_competition)
+        high_competition = np.logical_and.reduce([
+            self._score >= 85, self._salary <= 100000, self._cols['has_big_tech']
+        ])
+
+        competition_indicators['high_competition_candidates'] = int(high_competition.sum())
         competition_indicators['avg_score_threshold'] = 85
-        competition_indicators['competitive_locations'] = high_competition['country'].value_counts().to_dict()
+        competition_indicators['competitive_locations'] = pd.Series(
+            self._country[high_competition]
+        ).value_counts().to_dict()
         
         return competition_indicators
     
@@ -537,30 +852,25 @@ class HiringInsightsGenerator:
         recommendations = []
         
         # Immediate hire recommendations
-        immediate_candidates = self.df[
-            (self.df['overall_score'] >= 80) & 
-            (self.df['salary_full_time'] <= 90000) & 
-            (self.df['is_full_stack'] == True)
-        ].nlargest(10, 'overall_score')
+        immediate_candidates = self._top_by_score(self._shared_masks()['core_full_stack'], 10)
         
         recommendations.append({
             'priority': 'IMMEDIATE',
             'reason': 'High-value full-stack candidates with reasonable salary expectations',
             'count': len(immediate_candidates),
-            'candidates': immediate_candidates[['name', 'overall_score', 'salary_full_time']].to_dict('records')
+            'candidates': self._records(immediate_candidates, ['name', 'overall_score', 'salary_full_time'])
         })
         
         # Strategic hire recommendations
-        strategic_candidates = self.df[
-            (self.df['has_lead_role'] == True) & 
-            (self.df['overall_score'] >= 75)
-        ].nlargest(10, 'overall_score')
+        strategic_candidates = self._top_by_score(
+            self._cols['has_lead_role'] & (self._score >= 75), 10
+        )
         
         recommendations.append({
             'priority': 'STRATEGIC',
             'reason': 'Leadership experience candidates for senior positions',
             'count': len(strategic_candidates),
-            'candidates': strategic_candidates[['name', 'overall_score', 'salary_full_time']].to_dict('records')
+            'candidates': self._records(strategic_candidates, ['name', 'overall_score', 'salary_full_time'])
         })
         
         return recommendations
@@ -569,11 +879,8 @@ class HiringInsightsGenerator:
         """Analyze market timing for different hiring strategies"""
         timing_analysis = {}
         
-        # Parse submission dates
-        self.df['submitted_date'] = pd.to_datetime(self.df['submitted_at'], errors='coerce')
-        
-        # Recent application trends
-        recent_data = self.df[self.df['submitted_date'] >= '2025-01-26']
+        # Recent application trends, using the dates parsed in __init__
+        recent_data = self.df[self._submitted_date >= '2025-01-26']
         
         timing_analysis = {
             'recent_application_volume': len(recent_data),
@@ -592,78 +899,80 @@ class HiringInsightsGenerator:
         if len(recent_data) == 0:
             return {}
         
-        recent_skills = Counter()
-        overall_skills = Counter()
-        
-        # Recent skills
-        for idx, row in recent_data.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            recent_skills.update(skills)
-        
-        # Overall skills
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            overall_skills.update(skills)
-        
-        # Calculate trend shifts
-        trending_skills = {}
-        for skill in recent_skills.keys():
-            recent_freq = recent_skills[skill] / len(recent_data)
-            overall_freq = overall_skills[skill] / len(self.df)
-            
-            if recent_freq > overall_freq * 1.2:  # 20% increase threshold
-                trending_skills[skill] = {
-                    'recent_frequency': recent_freq,
-                    'overall_frequency': overall_freq,
-                    'trend_strength': (recent_freq - overall_freq) / overall_freq
-                }
-        
-        return dict(sorted(trending_skills.items(), key=lambda x: x[1]['trend_strength'], reverse=True)[:10])
+        # Recent and overall skill counts are column sums over the shared
+        # candidate × skill matrix; the trend ratio is one elementwise divide
+        matrix, skill_names = self._full_skill_matrix()
+        overall_counts = np.asarray(matrix.sum(axis=0)).ravel()
+        recent_counts = np.asarray(matrix[recent_data.index.to_numpy()].sum(axis=0)).ravel()
+
+        recent_freq = recent_counts / len(recent_data)
+        overall_freq = overall_counts / len(self.df)
+
+        # 20% increase threshold
+        trending = np.flatnonzero((recent_counts > 0) & (recent_freq > overall_freq * 1.2))
+        trend_strength = (recent_freq[trending] - overall_freq[trending]) / overall_freq[trending]
+
+        order = np.argpartition(-trend_strength, 10)[:10] if trending.size > 10 else np.arange(trending.size)
+        top = trending[order[np.argsort(-trend_strength[order])]]
+        return {
+            skill_names[idx]: {
+                'recent_frequency': recent_freq[idx],
+                'overall_frequency': overall_freq[idx],
+                'trend_strength': (recent_freq[idx] - overall_freq[idx]) / overall_freq[idx]
+            }
+            for idx in top
+        }
     
     def assess_hiring_risks(self):
         """Assess various hiring risks and mitigation strategies"""
         risk_assessment = {}
         
         # Talent flight risk (high-quality, high-salary candidates)
-        flight_risk = self.df[
-            (self.df['overall_score'] >= 85) & 
-            (self.df['salary_full_time'] >= 120000) &
-            (self.df['has_big_tech'] == True)
-        ]
+        flight_risk = np.logical_and.reduce([
+            self._score >= 85, self._salary >= 120000, self._cols['has_big_tech']
+        ])
         
-        # Skill shortage risk
-        critical_skill_shortage = {}
-        for category, skills in self.critical_skills.items():
-            candidates_with_category = 0
-            for skill in skills:
-                for idx, row in self.df.iterrows():
-                    candidate_skills = self.parse_skills(row.get('original_skills', ''))
-                    if skill in candidate_skills:
-                        candidates_with_category += 1
-                        break  # Count each candidate only once per category
-            
-            critical_skill_shortage[category] = {
-                'total_candidates': candidates_with_category,
-                'risk_level': 'high' if candidates_with_category < 20 else 'medium' if candidates_with_category < 50 else 'low'
+        # Skill shortage risk: candidates covering each category, counted
+        # once per candidate via the coverage matmul
+        categories, coverage = self._category_coverage()
+        candidates_per_category = coverage.sum(axis=0)
+
+        # Risk labels bucketed lane-wise over the whole category vector
+        risk_levels = np.select(
+            [candidates_per_category < 20, candidates_per_category < 50],
+            ['high', 'medium'], default='low'
+        )
+        critical_skill_shortage = {
+            category: {
+                'total_candidates': int(count),
+                'risk_level': risk_level
             }
-        
+            for category, count, risk_level in zip(categories, candidates_per_category, risk_levels)
+        }
+
         # Geographic concentration risk
-        top_countries = self.df['country'].value_counts().head(3)
+        top_countries = self._country_counts.head(3)
         geographic_concentration = top_countries.sum() / len(self.df)
-        
+        concentration_risk = ['low', 'medium', 'high'][
+            np.searchsorted([0.5, 0.7], geographic_concentration, side='left')
+        ]
+
         risk_assessment = {
             'talent_flight_risk': {
-                'high_risk_candidates': len(flight_risk),
+                'high_risk_candidates': int(flight_risk.sum()),
                 'mitigation': 'competitive_offers_and_equity'
             },
             'skill_shortage_risks': critical_skill_shortage,
             'geographic_concentration': {
                 'concentration_ratio': geographic_concentration,
-                'risk_level': 'high' if geographic_concentration > 0.7 else 'medium' if geographic_concentration > 0.5 else 'low',
+                'risk_level': concentration_risk,
                 'top_countries': top_countries.to_dict()
             },
             'budget_inflation_risk': {
-                'avg_salary_top_quartile': self.df.nlargest(int(len(self.df) * 0.25), 'overall_score')['salary_full_time'].mean(),
+                # Top score quartile isolated with quickselect, no full sort
+                'avg_salary_top_quartile': self._salary[
+                    np.argpartition(-self._score, int(len(self.df) * 0.25))[:int(len(self.df) * 0.25)]
+                ].mean(),
                 'market_rate_pressure': 'increasing'
             }
         }
@@ -678,18 +987,14 @@ class HiringInsightsGenerator:
         immediate_actions = []
         
         # High-value, low-cost candidates
-        bargain_candidates = self.df[
-            (self.df['overall_score'] >= 75) &
-            (self.df['salary_full_time'] <= 60000) &
-            (self.df['salary_full_time'] > 0)
-        ].nlargest(5, 'overall_score')
+        bargain_candidates = self._top_by_score(self._shared_masks()['bargain'], 5)
         
         if len(bargain_candidates) > 0:
             immediate_actions.append({
                 'action': 'immediate_outreach',
                 'priority': 'HIGH',
                 'description': f'Contact {len(bargain_candidates)} high-value, budget-friendly candidates',
-                'candidates': bargain_candidates[['name', 'overall_score', 'salary_full_time', 'country']].to_dict('records'),
+                'candidates': self._records(bargain_candidates, ['name', 'overall_score', 'salary_full_time', 'country']),
                 'timeline': '24-48 hours'
             })
         
@@ -727,76 +1032,72 @@ class HiringInsightsGenerator:
     def identify_skill_gaps(self):
         """Identify critical skill gaps in the candidate pool"""
         gaps = []
-        
-        for category, skills in self.critical_skills.items():
-            category_count = 0
-            for skill in skills:
-                for idx, row in self.df.iterrows():
-                    candidate_skills = self.parse_skills(row.get('original_skills', ''))
-                    if skill in candidate_skills:
-                        category_count += 1
-                        break  # Count each candidate only once per category
-            
+
+        # Candidates covering each category come from the shared coverage
+        # matrix — one column sum per category, no row scans
+        categories, coverage = self._category_coverage()
+        candidates_per_category = coverage.sum(axis=0)
+
+        for category, category_count in zip(categories, candidates_per_category):
+            category_count = int(category_count)
             if category_count < 15:  # Threshold for scarcity
                 gaps.append({
                     'category': category,
-                    'skills': skills,
+                    'skills': self.critical_skills[category],
                     'current_candidates': category_count,
                     'urgency': 'high' if category_count < 10 else 'medium'
                 })
-        
+
         return gaps
     
     def identify_geographic_opportunities(self):
         """Identify underrepresented geographic regions with potential"""
-        country_stats = self.df.groupby('country').agg({
-            'overall_score': 'mean',
-            'salary_full_time': 'mean',
-            'name': 'count'
-        }).round(2)
-        
+        country_stats = self._country_summary()
+
         # Find countries with high quality but low representation
-        opportunities = []
-        for country, stats in country_stats.iterrows():
-            if stats['name'] < 10 and stats['overall_score'] > 70:  # Less than 10 candidates but high quality
-                opportunities.append({
-                    'country': country,
-                    'avg_score': stats['overall_score'],
-                    'avg_salary': stats['salary_full_time'],
-                    'candidate_count': stats['name']
-                })
-        
-        return sorted(opportunities, key=lambda x: x['avg_score'], reverse=True)[:5]
+        opportunities = [
+            {
+                'country': row.country,
+                'avg_score': round(float(row.overall_score), 2),
+                'avg_salary': round(float(row.salary_full_time), 2),
+                'candidate_count': row.name
+            }
+            for row in country_stats.reset_index().itertuples(index=False)
+            if row.name < 10 and row.overall_score > 70  # Less than 10 candidates but high quality
+        ]
+
+        return heapq.nlargest(5, opportunities, key=itemgetter('avg_score'))
     
     def generate_team_building_strategies(self):
         """Generate specific team building strategies"""
         strategies = []
         
         # Core team strategy
-        core_team = self.df[
-            (self.df['overall_score'] >= 80) &
-            (self.df['is_full_stack'] == True) &
-            (self.df['salary_full_time'] <= 90000)
-        ].head(3)
+        core_team = self.df.iloc[np.flatnonzero(self._shared_masks()['core_full_stack'])[:3]]
         
         if len(core_team) > 0:
             strategies.append({
                 'strategy': 'core_team_first',
                 'description': 'Build strong core team with full-stack capabilities',
-                'candidates': core_team[['name', 'overall_score', 'primary_skill_category']].to_dict('records'),
+                'candidates': self._records(core_team, ['name', 'overall_score', 'primary_skill_category']),
                 'budget_estimate': core_team['salary_full_time'].sum()
             })
         
         # Specialization strategy
         specialists = []
         for category in ['data', 'cloud', 'mobile']:
-            specialist = self.df[
-                (self.df['primary_skill_category'] == category) &
-                (self.df['overall_score'] >= 75)
-            ].nlargest(1, 'overall_score')
+            specialist = self._top_by_score(
+                (self._cols['primary_skill_category'] == category) & (self._score >= 75), 1
+            )
             
             if len(specialist) > 0:
-                specialists.extend(specialist.to_dict('records'))
+                # Emit a deliberate field list rather than whole rows, so
+                # the record shape no longer depends on which columns the
+                # pruned load happened to keep
+                specialists.extend(self._records(specialist, [
+                    'name', 'country', 'overall_score', 'salary_full_time',
+                    'primary_skill_category', 'experience_level'
+                ]))
         
         if specialists:
             strategies.append({
@@ -813,12 +1114,8 @@ class HiringInsightsGenerator:
         tactics = []
         
         # Geographic arbitrage tactic
-        arbitrage_countries = self.df.groupby('country').agg({
-            'overall_score': 'mean',
-            'salary_full_time': 'mean',
-            'name': 'count'
-        }).round(2)
-        
+        arbitrage_countries = self._country_summary()
+
         # Find countries with high quality, low cost
         value_countries = arbitrage_countries[
             (arbitrage_countries['overall_score'] > 70) &
@@ -830,7 +1127,7 @@ class HiringInsightsGenerator:
             tactics.append({
                 'tactic': 'geographic_arbitrage',
                 'description': 'Focus hiring in high-value, lower-cost countries',
-                'target_countries': value_countries.head(3).to_dict(),
+                'target_countries': value_countries.head(3).round(2).to_dict(),
                 'potential_savings': '20-40% vs US market rates'
             })
         
@@ -868,7 +1165,9 @@ class HiringInsightsGenerator:
         ]
         
         # University partnerships
-        top_schools = self.df[self.df['has_top_school'] == True]['highest_education_level'].value_counts()
+        top_schools = self._present_counts(
+            self.df[self.df['has_top_school'] == True]['highest_education_level']
+        )
         
         pipeline = {
             'emerging_talent_pool': {
@@ -903,18 +1202,37 @@ class HiringInsightsGenerator:
     def analyze_cost_efficiency(self):
         """Analyze cost efficiency of different candidate profiles"""
         efficiency_analysis = {}
-        
-        # Cost per skill point
-        candidates_with_salary = self.df[self.df['salary_full_time'] > 0].copy()
-        candidates_with_salary['cost_per_skill'] = candidates_with_salary['salary_full_time'] / candidates_with_salary['total_skills']
-        candidates_with_salary['value_score'] = candidates_with_salary['overall_score'] / (candidates_with_salary['salary_full_time'] / 1000)
-        
-        efficiency_analysis['top_value_candidates'] = candidates_with_salary.nlargest(10, 'value_score')[
-            ['name', 'overall_score', 'salary_full_time', 'value_score', 'country']
-        ].to_dict('records')
-        
-        efficiency_analysis['cost_per_skill_by_country'] = candidates_with_salary.groupby('country')['cost_per_skill'].mean().sort_values().head(10).to_dict()
-        
+
+        # Cost per skill point on the cached arrays: guarded divides, no
+        # full-frame copy, and O(n) top-10 selection
+        idx = np.flatnonzero(self._valid_salary)
+        salaries = self._salary[idx].astype(np.float64)
+        scores = self._score[idx].astype(np.float64)
+        total_skills = self.df['total_skills'].to_numpy()[idx]
+
+        # Zero-skill rows divide to inf (matching salary/0), so they sink
+        # to the bottom of the cheapest-per-skill ranking instead of
+        # leading it
+        cost_per_skill = np.divide(
+            salaries, total_skills,
+            out=np.full_like(salaries, np.inf), where=total_skills > 0
+        )
+        value_score = scores / (salaries / 1000.0)
+
+        top = np.argpartition(-value_score, min(10, value_score.size - 1))[:10] if value_score.size else []
+        top = top[np.argsort(-value_score[top])] if len(top) else top
+        records = self._records(
+            self.df.iloc[idx[top]], ['name', 'overall_score', 'salary_full_time', 'country']
+        )
+        for record, i in zip(records, top):
+            record['value_score'] = value_score[i]
+        efficiency_analysis['top_value_candidates'] = records
+
+        efficiency_analysis['cost_per_skill_by_country'] = (
+            pd.Series(cost_per_skill, index=self._country[idx])
+            .groupby(level=0).mean().sort_values().head(10).to_dict()
+        )
+
         return efficiency_analysis
     
     def generate_budget_strategies(self):
@@ -931,51 +1249,83 @@ class HiringInsightsGenerator:
     
     def optimize_team_for_budget(self, total_budget):
         """Optimize team selection for a specific budget"""
-        eligible_candidates = self.df[
-            (self.df['salary_full_time'] > 0) & 
-            (self.df['salary_full_time'] <= total_budget * 0.4) & 
-            (self.df['overall_score'] >= 60)
-        ].copy()
-        
+        # Slice the affordability window out of the pre-sorted salaries,
+        # then apply the score floor only to that subset
+        sal_idx, sal_sorted = self._salary_order()
+        lo = np.searchsorted(sal_sorted, 0, side='right')
+        hi = np.searchsorted(sal_sorted, total_budget * 0.4, side='right')
+        candidate_idx = sal_idx[lo:hi]
+        candidate_idx = candidate_idx[self._score[candidate_idx] >= 60]
+
         # Simple greedy optimization
         selected_team = []
         remaining_budget = total_budget
         used_countries = set()
         covered_skills = set()
-        
-        # Sort by value score
-        eligible_candidates['value_score'] = eligible_candidates['overall_score'] / (eligible_candidates['salary_full_time'] / 1000)
-        eligible_candidates = eligible_candidates.sort_values('value_score', ascending=False)
-        
-        for idx, candidate in eligible_candidates.iterrows():
-            if len(selected_team) >= 5:
-                break
-                
-            if candidate['salary_full_time'] <= remaining_budget:
-                # Diversity bonus
-                diversity_bonus = 0
-                if candidate['country'] not in used_countries:
-                    diversity_bonus += 5
-                if len(used_countries) < 3:
-                    diversity_bonus += 2
-                
-                candidate_score = candidate['overall_score'] + diversity_bonus
-                
-                selected_team.append({
-                    'name': candidate['name'],
-                    'score': candidate['overall_score'],
-                    'salary': candidate['salary_full_time'],
-                    'country': candidate['country'],
-                    'skills': candidate['primary_skill_category'],
-                    'adjusted_score': candidate_score
-                })
-                
-                remaining_budget -= candidate['salary_full_time']
-                used_countries.add(candidate['country'])
-                
-                # Track covered skills
-                skills = self.parse_skills(candidate.get('original_skills', ''))
-                covered_skills.update(skills)
+
+        # Value score on the cached arrays; only a ~50 candidate shortlist
+        # is ever realized in sorted order (O(n + k log k), not O(n log n))
+        sub_salaries = self._salary[candidate_idx].astype(np.float64)
+        sub_scores = self._score[candidate_idx].astype(np.float64)
+        values = sub_scores / (sub_salaries / 1000)
+        cols = ['name', 'overall_score', 'salary_full_time', 'country', 'primary_skill_category']
+
+        shortlist = min(50, len(values))
+        if shortlist:
+            order = np.argpartition(-values, shortlist - 1)[:shortlist]
+            order = order[np.argsort(-values[order], kind='stable')]
+        else:
+            order = np.empty(0, dtype=np.int64)
+
+        # The affordability scan is pure numeric, so it runs as a jitted
+        # kernel over the sorted salary array when numba is available.
+        # The diversity bonus only affects the reported adjusted_score,
+        # not which candidates are picked, so it is applied afterwards.
+        def greedy_pick(salaries_in_order):
+            if NUMBA_AVAILABLE:
+                return _greedy_select_kernel(salaries_in_order, float(total_budget), 5)
+            chosen = []
+            remaining = float(total_budget)
+            for i, salary in enumerate(salaries_in_order):
+                if len(chosen) >= 5:
+                    break
+                if salary <= remaining:
+                    chosen.append(i)
+                    remaining -= salary
+            return chosen
+
+        chosen = greedy_pick(sub_salaries[order])
+        if len(chosen) < 5 and shortlist < len(values):
+            # Rare: the shortlist could not fill the team, so fall back
+            # to the full value order
+            order = np.argsort(-values, kind='stable')
+            chosen = greedy_pick(sub_salaries[order])
+        picked = self.df.iloc[candidate_idx[order[np.asarray(chosen, dtype=np.int64)]]]
+
+        for idx, candidate in zip(picked.index, picked[cols].itertuples(index=False)):
+            # Diversity bonus
+            diversity_bonus = 0
+            if candidate.country not in used_countries:
+                diversity_bonus += 5
+            if len(used_countries) < 3:
+                diversity_bonus += 2
+
+            candidate_score = candidate.overall_score + diversity_bonus
+
+            selected_team.append({
+                'name': candidate.name,
+                'score': candidate.overall_score,
+                'salary': candidate.salary_full_time,
+                'country': candidate.country,
+                'skills': candidate.primary_skill_category,
+                'adjusted_score': candidate_score
+            })
+
+            remaining_budget -= candidate.salary_full_time
+            used_countries.add(candidate.country)
+
+            # Track covered skills
+            covered_skills.update(self._skill_sets[idx])
         
         return {
             'team_size': len(selected_team),
@@ -990,31 +1340,39 @@ class HiringInsightsGenerator:
     def generate_comprehensive_report(self):
         """Generate the most comprehensive hiring insights report"""
         print("🔍 Generating Ultra-Comprehensive Hiring Insights...")
-        
-        report = {
-            'timestamp': datetime.now().isoformat(),
-            'executive_summary': self.generate_executive_summary(),
-            'dataset_overview': self.generate_dataset_overview(),
-            'market_intelligence': self.generate_market_intelligence(),
-            'team_composition': self.generate_team_composition_insights(),
-            'hiring_strategy': self.generate_hiring_strategy_insights(),
-            'budget_optimization': self.generate_budget_optimization_insights(),
-            'actionable_recommendations': self.generate_actionable_recommendations(),
-            'risk_mitigation': self.assess_hiring_risks(),
-            'success_metrics': self.define_success_metrics()
+
+        # Warm the lazily built caches so the worker threads only read
+        self._full_skill_matrix()
+        self._category_coverage()
+        self._country_summary()
+        self._shared_masks()
+
+        # The sections are independent read-only computations, and the
+        # heavy pandas/numpy work releases the GIL, so they overlap well
+        sections = {
+            'executive_summary': self.generate_executive_summary,
+            'dataset_overview': self.generate_dataset_overview,
+            'market_intelligence': self.generate_market_intelligence,
+            'team_composition': self.generate_team_composition_insights,
+            'hiring_strategy': self.generate_hiring_strategy_insights,
+            'budget_optimization': self.generate_budget_optimization_insights,
+            'actionable_recommendations': self.generate_actionable_recommendations,
+            'risk_mitigation': self.assess_hiring_risks,
+            'success_metrics': self.define_success_metrics
         }
-        
+        report = {'timestamp': datetime.now().isoformat()}
+        with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+            futures = {key: executor.submit(section) for key, section in sections.items()}
+            report.update({key: future.result() for key, future in futures.items()})
+
         return report
     
     def generate_executive_summary(self):
         """Generate executive summary with key insights"""
-        high_value_candidates = len(self.df[
-            (self.df['overall_score'] >= 80) & 
-            (self.df['salary_full_time'] <= 100000)
-        ])
+        high_value_candidates = int(self._shared_masks()['high_value_100k'].sum())
         
         avg_score = self.df['overall_score'].mean()
-        total_countries = len(self.df['country'].unique())
+        total_countries = self._n_unique['country']
         
         return {
             'total_candidates_analyzed': len(self.df),
@@ -1028,43 +1386,46 @@ class HiringInsightsGenerator:
     
     def generate_dataset_overview(self):
         """Generate comprehensive dataset overview with fixed skills parsing"""
-        # Get all unique skills safely
-        all_skills = set()
-        for idx, row in self.df.iterrows():
-            skills = self.parse_skills(row.get('original_skills', ''))
-            all_skills.update(skills)
-        
+        # The skill universe is exactly the shared matrix's column set
+        _, all_skills = self._full_skill_matrix()
+
+        # Score and salary statistics computed together on the cached
+        # arrays: one percentile call and one filtered slice instead of a
+        # full column scan per statistic
+        score_p50, score_p75, score_p90 = np.percentile(self._score, [50, 75, 90])
+        salaries = self._salary[self._valid_salary]
+
         return {
             'total_candidates': len(self.df),
             'score_distribution': {
-                'mean': round(self.df['overall_score'].mean(), 2),
-                'median': round(self.df['overall_score'].median(), 2),
-                'std': round(self.df['overall_score'].std(), 2),
-                'top_10_percent_threshold': round(self.df['overall_score'].quantile(0.9), 2),
-                'top_25_percent_threshold': round(self.df['overall_score'].quantile(0.75), 2)
+                'mean': round(self._score.mean(), 2),
+                'median': round(score_p50, 2),
+                'std': round(self._score.std(ddof=1), 2),
+                'top_10_percent_threshold': round(score_p90, 2),
+                'top_25_percent_threshold': round(score_p75, 2)
             },
             'geographic_coverage': {
-                'total_countries': len(self.df['country'].unique()),
-                'top_5_countries': self.df['country'].value_counts().head(5).to_dict(),
+                'total_countries': self._n_unique['country'],
+                'top_5_countries': self._country_counts.head(5).to_dict(),
                 'timezone_coverage': self.df['timezone_group'].value_counts().to_dict()
             },
             'skill_landscape': {
                 'total_unique_skills': len(all_skills),
                 'skill_categories': self.df['primary_skill_category'].value_counts().to_dict(),
-                'full_stack_candidates': len(self.df[self.df['is_full_stack'] == True])
+                'full_stack_candidates': int(self._cols['is_full_stack'].sum())
             },
             'experience_profile': {
                 'experience_levels': self.df.get('experience_level', pd.Series()).value_counts().to_dict(),
-                'big_tech_background': len(self.df[self.df['has_big_tech'] == True]),
-                'senior_roles': len(self.df[self.df['has_senior_role'] == True])
+                'big_tech_background': int(self._cols['has_big_tech'].sum()),
+                'senior_roles': int(self._cols['has_senior_role'].sum())
             },
             'salary_insights': {
-                'candidates_with_salary': len(self.df[self.df['salary_full_time'] > 0]),
-                'avg_salary_expectation': round(self.df[self.df['salary_full_time'] > 0]['salary_full_time'].mean(), 2),
+                'candidates_with_salary': len(salaries),
+                'avg_salary_expectation': round(salaries.mean(), 2),
                 'salary_range': {
-                    'min': self.df[self.df['salary_full_time'] > 0]['salary_full_time'].min(),
-                    'max': self.df[self.df['salary_full_time'] > 0]['salary_full_time'].max(),
-                    'median': round(self.df[self.df['salary_full_time'] > 0]['salary_full_time'].median(), 2)
+                    'min': salaries.min(),
+                    'max': salaries.max(),
+                    'median': round(np.median(salaries), 2)
                 }
             }
         }
@@ -1097,10 +1458,20 @@ class HiringInsightsGenerator:
     def save_insights_report(self, filename='comprehensive_hiring_insights.json'):
         """Save the ultra-comprehensive insights to JSON file"""
         report = self.generate_comprehensive_report()
-        
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
-        
+
+        if ORJSON_AVAILABLE:
+            # orjson serializes numpy scalars natively, so most values skip
+            # the default=str boxing path entirely
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
+
         print(f"💾 Ultra-comprehensive hiring insights saved to {filename}")
         return report
 
@@ -2,40 +2,177 @@
 Scoring utilities for candidate evaluation
 Contains all scoring algorithms and metrics calculation functions
 """
+import bisect
 import pandas as pd
 import numpy as np
 import re
-from collections import Counter
+
+# Deletion table that strips non-digit characters in one C-level pass,
+# replacing the per-string regex substitution in salary parsing
+_NON_DIGIT_TABLE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit())
+)
+
+# Optional numba kernel for the detailed skills accumulator
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _skills_accumulator(cat_bits, high_flags):
+        """OR per-skill category bits and count high-demand hits in one pass"""
+        mask = np.int64(0)
+        high_demand = 0
+        for i in range(cat_bits.shape[0]):
+            mask |= cat_bits[i]
+            high_demand += high_flags[i]
+        return mask, high_demand
 
 class CandidateScorer:
+    # Lookup tables the scoring methods previously rebuilt on every call
+    _LOCATION_MULTIPLIERS = {
+        'United States': 1.0, 'Canada': 0.8, 'Germany': 0.9, 'United Kingdom': 0.9,
+        'Australia': 0.8, 'India': 0.3, 'Brazil': 0.4, 'Mexico': 0.5,
+        'Argentina': 0.4, 'Pakistan': 0.2, 'Bangladesh': 0.2
+    }
+    _LEVEL_SCORES_BASIC = {
+        'Doctorate': 20,
+        "Master's Degree": 15,
+        "Bachelor's Degree": 10,
+        "Associate's Degree": 5,
+        'High School Diploma': 2
+    }
+    _LEVEL_SCORES_DETAILED = {
+        'Doctorate': 25,
+        "Master's Degree": 20,
+        "Bachelor's Degree": 15,
+        "Associate's Degree": 10,
+        'High School Diploma': 5
+    }
+    _TECH_SUBJECTS = (
+        'Computer Science', 'Information Technology', 'Software',
+        'Data Science', 'Machine Learning'
+    )
+    _ENHANCED_SCORE_KEYS = (
+        'detailed_experience_score', 'detailed_skills_score',
+        'detailed_education_score', 'market_value_score', 'completeness_score'
+    )
+    # Experience-level buckets: label i applies from bins[i-1] (inclusive)
+    _LEVEL_LABELS = ('Entry-Level', 'Junior', 'Mid-Level', 'Senior')
+    _BASIC_LEVEL_BINS = (8, 15, 20)
+    _ENHANCED_LEVEL_BINS = (10, 25, 40)
+
     def __init__(self):
-        # Define skill categories
+        # Define skill categories (frozensets for O(1) membership checks)
         self.skill_categories = {
-            'frontend': ['React', 'Angular', 'Vue JS', 'HTML/CSS', 'JavaScript', 'TypeScript', 'Bootstrap', 'Next JS'],
-            'backend': ['Node JS', 'Django', 'Flask', 'Express', 'FastAPI', 'Spring Boot', 'Laravel', 'PHP'],
-            'mobile': ['React Native', 'Flutter', 'Swift', 'Kotlin', 'Android', 'iOS'],
-            'data': ['Machine Learning', 'Data Analysis', 'Pandas', 'Tensorflow', 'Pytorch', 'Computer Vision', 'NLP'],
-            'database': ['SQL', 'PostgreSQL', 'MongoDB', 'NoSQL', 'Redis', 'MySQL'],
-            'cloud': ['Amazon Web Services', 'Azure', 'Google Cloud Platform', 'Docker', 'Kubernetes'],
-            'devops': ['Jenkins', 'Terraform', 'Ansible', 'CI/CD', 'Docker', 'Kubernetes'],
-            'languages': ['Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust']
+            'frontend': frozenset(['React', 'Angular', 'Vue JS', 'HTML/CSS', 'JavaScript', 'TypeScript', 'Bootstrap', 'Next JS']),
+            'backend': frozenset(['Node JS', 'Django', 'Flask', 'Express', 'FastAPI', 'Spring Boot', 'Laravel', 'PHP']),
+            'mobile': frozenset(['React Native', 'Flutter', 'Swift', 'Kotlin', 'Android', 'iOS']),
+            'data': frozenset(['Machine Learning', 'Data Analysis', 'Pandas', 'Tensorflow', 'Pytorch', 'Computer Vision', 'NLP']),
+            'database': frozenset(['SQL', 'PostgreSQL', 'MongoDB', 'NoSQL', 'Redis', 'MySQL']),
+            'cloud': frozenset(['Amazon Web Services', 'Azure', 'Google Cloud Platform', 'Docker', 'Kubernetes']),
+            'devops': frozenset(['Jenkins', 'Terraform', 'Ansible', 'CI/CD', 'Docker', 'Kubernetes']),
+            'languages': frozenset(['Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust'])
         }
-        
-        self.high_demand_skills = [
-            'React', 'JavaScript', 'Python', 'Node JS', 'TypeScript', 'Java', 
+
+        self.high_demand_skills = frozenset([
+            'React', 'JavaScript', 'Python', 'Node JS', 'TypeScript', 'Java',
             'Machine Learning', 'SQL', 'Amazon Web Services', 'Docker'
-        ]
-        
+        ])
+
         self.big_tech_companies = [
-            'Google', 'Amazon', 'Microsoft', 'Apple', 'Meta', 'Netflix', 
+            'Google', 'Amazon', 'Microsoft', 'Apple', 'Meta', 'Netflix',
             'Tesla', 'Uber', 'Airbnb', 'Spotify', 'Stripe'
         ]
-        
+
         self.senior_keywords = [
-            'Senior', 'Lead', 'Principal', 'Staff', 'Director', 'VP', 
+            'Senior', 'Lead', 'Principal', 'Staff', 'Director', 'VP',
             'CTO', 'Co-Founder', 'Head of', 'Chief'
         ]
 
+        self.lead_keywords = ['Lead', 'Manager', 'Director', 'VP', 'CTO']
+
+        # Memoized scoring results — many profiles share identical skill
+        # sets, so repeats become a dict hit keyed by the frozenset
+        self._basic_skills_cache = {}
+        self._detailed_skills_cache = {}
+        self._primary_category_cache = {}
+
+        # Specialize the completeness check into straight-line code once,
+        # since the field schema is fixed — no per-candidate loop over
+        # field names and no per-field branch dispatch
+        lines = ['def _completeness(candidate):', '    score = 0']
+        for field in ('name', 'email'):
+            lines += [
+                f"    value = candidate.get('{field}')",
+                '    if isinstance(value, str) and value.strip():',
+                '        score += 2',
+            ]
+        lines += [
+            "    value = candidate.get('skills')",
+            '    if isinstance(value, list) and len(value) > 0:',
+            '        score += 2',
+        ]
+        for field in ('work_experiences', 'education'):
+            lines += [
+                f"    if candidate.get('{field}'):",
+                '        score += 2',
+            ]
+        for field in ('phone', 'location'):
+            lines += [
+                f"    if candidate.get('{field}'):",
+                '        score += 1',
+            ]
+        lines.append('    return score')
+        namespace = {}
+        exec('\n'.join(lines), namespace)
+        self._completeness_fn = namespace['_completeness']
+
+        # Precompiled keyword alternations: one scan per string instead of
+        # one substring check per keyword
+        self.big_tech_pattern = re.compile('|'.join(map(re.escape, self.big_tech_companies)))
+        self.senior_pattern = re.compile('|'.join(map(re.escape, self.senior_keywords)))
+        self.lead_pattern = re.compile('|'.join(map(re.escape, self.lead_keywords)))
+        self.tech_subject_pattern = re.compile('|'.join(map(re.escape, self._TECH_SUBJECTS)))
+
+        # Integer ids plus packed per-skill category bits and high-demand
+        # flags, consumed by the jitted accumulator in the detailed scorer
+        self.category_bits = {cat: 1 << i for i, cat in enumerate(self.skill_categories)}
+        known_skills = sorted(
+            frozenset().union(*self.skill_categories.values()) | self.high_demand_skills
+        )
+        self.skill_to_id = {skill: i for i, skill in enumerate(known_skills)}
+        self._skill_cat_bits = np.zeros(len(known_skills), dtype=np.int64)
+        self._skill_high_demand = np.zeros(len(known_skills), dtype=np.int64)
+        for category, members in self.skill_categories.items():
+            for skill in members:
+                self._skill_cat_bits[self.skill_to_id[skill]] |= self.category_bits[category]
+        for skill in self.high_demand_skills:
+            self._skill_high_demand[self.skill_to_id[skill]] = 1
+        # skill -> OR of the bits of every category containing it; the
+        # pure-Python scorer accumulates coverage as one int instead of a
+        # per-candidate count dict
+        self._skill_to_catmask = {
+            skill: int(self._skill_cat_bits[idx])
+            for skill, idx in self.skill_to_id.items()
+        }
+
+        # Code arrays for the batch scorer: membership over integer codes
+        # (np.isin) instead of hashing skill strings per comparison
+        self._category_codes = {
+            category: np.array(
+                sorted(self.skill_to_id[skill] for skill in members), dtype=np.int16
+            )
+            for category, members in self.skill_categories.items()
+        }
+        self._high_demand_codes = np.array(
+            sorted(self.skill_to_id[skill] for skill in self.high_demand_skills),
+            dtype=np.int16
+        )
+
     def calculate_experience_score_basic(self, work_experiences):
         """Basic experience scoring (0-25 points)"""
         if not work_experiences:
@@ -58,91 +195,228 @@ class CandidateScorer:
         exp_count = len(work_experiences)
         score += min(exp_count * 4, 20)
         
-        # Seniority bonus (0-15 points)
+        # Seniority and big-tech bonuses in one traversal, each counted once
+        has_senior = has_big_tech = False
         for exp in work_experiences:
-            if isinstance(exp, dict):
-                role = exp.get('roleName', '')
-                if any(keyword in role for keyword in self.senior_keywords):
-                    score += 5
-                    break  # Only count once
-        
-        # Big tech bonus (0-15 points)
-        for exp in work_experiences:
-            if isinstance(exp, dict):
-                company = exp.get('company', '')
-                if any(tech_comp in company for tech_comp in self.big_tech_companies):
-                    score += 10
-                    break  # Only count once
-        
+            if not isinstance(exp, dict):
+                continue
+            if not has_senior and self.senior_pattern.search(exp.get('roleName', '')):
+                has_senior = True
+            if not has_big_tech and self.big_tech_pattern.search(exp.get('company', '')):
+                has_big_tech = True
+            if has_senior and has_big_tech:
+                break
+        score += 5 * has_senior + 10 * has_big_tech
+
         return min(score, 50)
 
+    @staticmethod
+    def _as_skill_set(skills):
+        """Normalize a skills argument to a frozenset for intersection counting"""
+        if isinstance(skills, frozenset):
+            return skills
+        if not isinstance(skills, list):
+            skills = [skills] if skills else []
+        return frozenset(skills)
+
     def calculate_skills_score_basic(self, skills):
         """Basic skills scoring (0-30 points)"""
         if not skills:
             return 0, {}
-        
+
+        skills = self._as_skill_set(skills)
+        cached = self._basic_skills_cache.get(skills)
+        if cached is not None:
+            return cached
         score = 0
-        
+
         # Base score for skill count (0-20 points)
         skill_count = len(skills)
         score += min(skill_count * 2, 20)
-        
+
         # High-demand skills bonus (0-10 points)
-        high_demand_count = sum(1 for skill in skills if skill in self.high_demand_skills)
+        high_demand_count = len(skills & self.high_demand_skills)
         score += min(high_demand_count * 2, 10)
-        
+
         skills_metrics = {
             'total_skills': skill_count,
             'high_demand_skills': high_demand_count,
             'categories': [],
             'is_full_stack': False
         }
-        
-        return min(score, 30), skills_metrics
+
+        result = min(score, 30), skills_metrics
+        self._basic_skills_cache[skills] = result
+        return result
 
     def calculate_skills_score_detailed(self, skills):
         """Detailed skills scoring (0-40 points)"""
         if not skills or len(skills) == 0:
             return 0, {}
         
+        skills = self._as_skill_set(skills)
+        cached = self._detailed_skills_cache.get(skills)
+        if cached is not None:
+            return cached
         score = 0
-        
-        # Convert to list if not already
-        if not isinstance(skills, list):
-            skills = [skills] if skills else []
-        
-        # Count skills per category
-        category_counts = {}
-        for category, category_skills in self.skill_categories.items():
-            count = sum(1 for skill in skills if skill in category_skills)
-            category_counts[category] = count
-        
-        # Base score for skill count (0-15 points)
         skill_count = len(skills)
+
+        if NUMBA_AVAILABLE:
+            # Map skills to ids once and run the jitted accumulator over
+            # the packed category bits and high-demand flags
+            skill_ids = np.fromiter(
+                (self.skill_to_id[skill] for skill in skills if skill in self.skill_to_id),
+                dtype=np.int64
+            )
+            if skill_ids.size:
+                mask, high_demand_count = _skills_accumulator(
+                    self._skill_cat_bits[skill_ids], self._skill_high_demand[skill_ids]
+                )
+                mask, high_demand_count = int(mask), int(high_demand_count)
+            else:
+                mask, high_demand_count = 0, 0
+        else:
+            # Same bitmask accumulation without the JIT: one int OR per
+            # skill, no per-category set intersections
+            mask = 0
+            for skill in skills:
+                mask |= self._skill_to_catmask.get(skill, 0)
+            high_demand_count = len(skills & self.high_demand_skills)
+        categories = [cat for cat, bit in self.category_bits.items() if mask & bit]
+
+        # Base score for skill count (0-15 points)
         score += min(skill_count * 1, 15)
-        
+
         # High-demand skills bonus (0-15 points)
-        high_demand_count = sum(1 for skill in skills if skill in self.high_demand_skills)
         score += min(high_demand_count * 3, 15)
-        
+
         # Skill diversity bonus (0-10 points)
-        categories_with_skills = sum(1 for count in category_counts.values() if count > 0)
+        categories_with_skills = bin(mask).count('1')
         diversity_score = categories_with_skills / len(self.skill_categories)
         score += diversity_score * 10
-        
-        # Full-stack determination
-        is_full_stack = category_counts['frontend'] > 0 and category_counts['backend'] > 0
-        
+
+        # Full-stack determination straight off the coverage bits
+        is_full_stack = bool(mask & self.category_bits['frontend']) and \
+                        bool(mask & self.category_bits['backend'])
+
         skills_metrics = {
             'total_skills': skill_count,
             'high_demand_skills': high_demand_count,
             'skill_categories_covered': categories_with_skills,
-            'categories': [cat for cat, count in category_counts.items() if count > 0],
+            'categories': categories,
             'is_full_stack': is_full_stack,
             'skills_diversity_score': diversity_score
         }
-        
-        return min(score, 40), skills_metrics
+
+        result = min(score, 40), skills_metrics
+        self._detailed_skills_cache[skills] = result
+        return result
+
+    def score_skills_batch(self, skills_series):
+        """Vectorized skills scoring for a whole Series of skill collections
+
+        Explodes the skills once, maps them to integer codes and aggregates
+        per candidate with bincount, replacing one Python scoring call per
+        row with a handful of column operations. Returns a DataFrame aligned
+        to the input index with the basic (0-30) and detailed (0-40) scores,
+        the detailed metrics, the per-category counts, and the primary
+        skill category — everything downstream needs from one pass.
+        """
+        total_skills = skills_series.map(len)
+        n_candidates = len(skills_series)
+
+        # Unknown skills drop out with the code mapping; every membership
+        # test below is an integer compare, not a string hash
+        codes = skills_series.explode().dropna().map(self.skill_to_id).dropna()
+        cand_pos = skills_series.index.get_indexer(codes.index)
+        skill_codes = codes.to_numpy(dtype=np.int16)
+
+        per_category = pd.DataFrame(
+            {
+                category: np.bincount(
+                    cand_pos[np.isin(skill_codes, self._category_codes[category])],
+                    minlength=n_candidates
+                )
+                for category in self.skill_categories
+            },
+            index=skills_series.index
+        )
+
+        high_demand = pd.Series(
+            np.bincount(
+                cand_pos[np.isin(skill_codes, self._high_demand_codes)],
+                minlength=n_candidates
+            ),
+            index=skills_series.index
+        )
+
+        covered = per_category > 0
+        categories_with_skills = covered.sum(axis=1)
+        diversity_score = categories_with_skills / len(self.skill_categories)
+        is_full_stack = covered['frontend'] & covered['backend']
+
+        batch = pd.DataFrame({
+            'skills_score_basic': np.minimum(
+                np.minimum(total_skills * 2, 20) + np.minimum(high_demand * 2, 10), 30
+            ),
+            'skills_score_detailed': np.minimum(
+                np.minimum(total_skills, 15) + np.minimum(high_demand * 3, 15)
+                + diversity_score * 10,
+                40
+            ),
+            'total_skills': total_skills,
+            'high_demand_skills': high_demand,
+            'skill_categories_covered': categories_with_skills,
+            'is_full_stack': is_full_stack,
+            'skills_diversity_score': diversity_score
+        }, index=skills_series.index)
+        covered_arr = covered.to_numpy()
+        batch['categories'] = [
+            [cat for cat, hit in zip(covered.columns, row) if hit]
+            for row in covered_arr
+        ]
+        batch = batch.join(per_category)
+        counts = per_category.to_numpy()
+        batch['primary_skill_category'] = np.where(
+            counts.any(axis=1),
+            per_category.columns.to_numpy()[counts.argmax(axis=1)],
+            'None'
+        )
+        return batch
+
+    def score_experience_batch(self, work_experiences_series):
+        """Vectorized experience scoring for a Series of experience lists
+
+        Computes the basic (0-25) and detailed (0-50) scores column-wise:
+        one regex pass over the exploded role/company strings instead of a
+        Python loop per candidate.
+        """
+        exp_count = work_experiences_series.map(
+            lambda exps: len(exps) if isinstance(exps, list) else 0
+        )
+
+        exploded = work_experiences_series.explode().dropna()
+        dict_rows = exploded[exploded.map(lambda exp: isinstance(exp, dict))]
+        roles = dict_rows.map(lambda exp: exp.get('roleName', '')).astype(str)
+        companies = dict_rows.map(lambda exp: exp.get('company', '')).astype(str)
+
+        has_senior = (
+            roles.str.contains(self.senior_pattern)
+            .groupby(level=0).any()
+            .reindex(work_experiences_series.index, fill_value=False)
+        )
+        has_big_tech = (
+            companies.str.contains(self.big_tech_pattern)
+            .groupby(level=0).any()
+            .reindex(work_experiences_series.index, fill_value=False)
+        )
+
+        return pd.DataFrame({
+            'experience_score_basic': np.minimum(exp_count * 8, 25),
+            'experience_score_detailed': np.minimum(
+                np.minimum(exp_count * 4, 20) + has_senior * 5 + has_big_tech * 10, 50
+            )
+        }, index=work_experiences_series.index)
 
     def calculate_education_score_basic(self, education):
         """Basic education scoring (0-20 points)"""
@@ -150,16 +424,8 @@ class CandidateScorer:
             return 0, {}
         
         highest_level = education.get('highest_level', '')
-        
-        level_scores = {
-            'Doctorate': 20,
-            "Master's Degree": 15,
-            "Bachelor's Degree": 10,
-            "Associate's Degree": 5,
-            'High School Diploma': 2
-        }
-        
-        score = level_scores.get(highest_level, 0)
+
+        score = self._LEVEL_SCORES_BASIC.get(highest_level, 0)
         
         education_metrics = {
             'highest_level': highest_level,
@@ -180,14 +446,7 @@ class CandidateScorer:
         degrees = education.get('degrees', [])
         
         # Base score for degree level (0-25 points)
-        level_scores = {
-            'Doctorate': 25,
-            "Master's Degree": 20,
-            "Bachelor's Degree": 15,
-            "Associate's Degree": 10,
-            'High School Diploma': 5
-        }
-        score += level_scores.get(highest_level, 0)
+        score += self._LEVEL_SCORES_DETAILED.get(highest_level, 0)
         
         if not degrees or not isinstance(degrees, list):
             education_metrics = {
@@ -209,10 +468,9 @@ class CandidateScorer:
         elif top50_count > 0:
             score += 5
         
-        # Tech degree bonus (0-5 points)
-        tech_subjects = ['Computer Science', 'Information Technology', 'Software', 'Data Science', 'Machine Learning']
+        # Tech degree bonus (0-5 points): one regex pass per subject string
         has_tech_degree = any(
-            any(subject in degree.get('subject', '') for subject in tech_subjects)
+            self.tech_subject_pattern.search(degree.get('subject', ''))
             for degree in degrees if isinstance(degree, dict)
         )
         if has_tech_degree:
@@ -238,7 +496,10 @@ class CandidateScorer:
             if not salary_str:
                 return 0
             if isinstance(salary_str, str):
-                numeric = re.sub(r'[^\d]', '', salary_str)
+                numeric = salary_str.translate(_NON_DIGIT_TABLE)
+                if numeric and not numeric.isdigit():
+                    # Rare non-ASCII leftovers the table does not cover
+                    numeric = ''.join(c for c in numeric if c.isdigit())
                 return int(numeric) if numeric else 0
             return salary_str
         
@@ -247,16 +508,9 @@ class CandidateScorer:
         if full_time_salary == 0:
             return 0
         
-        # Location-based salary adjustments
-        location_multipliers = {
-            'United States': 1.0, 'Canada': 0.8, 'Germany': 0.9, 'United Kingdom': 0.9,
-            'Australia': 0.8, 'India': 0.3, 'Brazil': 0.4, 'Mexico': 0.5,
-            'Argentina': 0.4, 'Pakistan': 0.2, 'Bangladesh': 0.2
-        }
-        
-        # Get country from location
-        country = location.split(',')[-1].strip() if location else 'Other'
-        multiplier = location_multipliers.get(country, 0.5)
+        # Get country from location — rpartition avoids the split list
+        country = location.rpartition(',')[2].strip() if location else 'Other'
+        multiplier = self._LOCATION_MULTIPLIERS.get(country, 0.5)
         
         adjusted_salary = full_time_salary * multiplier
         
@@ -272,28 +526,7 @@ class CandidateScorer:
 
     def calculate_profile_completeness_score(self, candidate):
         """Calculate profile completeness score (0-12 points)"""
-        required_fields = ['name', 'email', 'skills', 'work_experiences', 'education']
-        optional_fields = ['phone', 'location']
-        
-        score = 0
-        
-        # Required fields (2 points each)
-        for field in required_fields:
-            value = candidate.get(field)
-            if value:
-                if field == 'skills' and isinstance(value, list) and len(value) > 0:
-                    score += 2
-                elif field in ['work_experiences', 'education'] and value:
-                    score += 2
-                elif field in ['name', 'email'] and isinstance(value, str) and value.strip():
-                    score += 2
-        
-        # Optional fields (1 point each)
-        for field in optional_fields:
-            if candidate.get(field):
-                score += 1
-        
-        return score
+        return self._completeness_fn(candidate)
 
     def calculate_overall_score_basic(self, candidate_features):
         """Calculate basic overall score (0-100 points)"""
@@ -319,60 +552,38 @@ class CandidateScorer:
 
     def calculate_overall_score_enhanced(self, candidate_features):
         """Calculate enhanced overall score (0-162 points)"""
-        score = 0
-        
-        # Enhanced Experience (50 points max)
-        score += candidate_features.get('detailed_experience_score', 0)
-        
-        # Enhanced Skills (40 points max)
-        score += candidate_features.get('detailed_skills_score', 0)
-        
-        # Enhanced Education (40 points max)
-        score += candidate_features.get('detailed_education_score', 0)
-        
-        # Market value (20 points max)
-        score += candidate_features.get('market_value_score', 0)
-        
-        # Profile completeness (12 points max)
-        score += candidate_features.get('completeness_score', 0)
-        
+        # Experience (50) + skills (40) + education (40) + market value
+        # (20) + completeness (12), summed over the fixed key tuple
+        score = sum(
+            candidate_features.get(key, 0) for key in self._ENHANCED_SCORE_KEYS
+        )
         return min(score, 162)
 
     def get_experience_level_category(self, experience_score, use_enhanced=False):
         """Categorize experience level based on score"""
-        if use_enhanced:
-            # Enhanced scoring thresholds (0-50)
-            if experience_score >= 40:
-                return 'Senior'
-            elif experience_score >= 25:
-                return 'Mid-Level'
-            elif experience_score >= 10:
-                return 'Junior'
-            else:
-                return 'Entry-Level'
-        else:
-            # Basic scoring thresholds (0-25)
-            if experience_score >= 20:
-                return 'Senior'
-            elif experience_score >= 15:
-                return 'Mid-Level'
-            elif experience_score >= 8:
-                return 'Junior'
-            else:
-                return 'Entry-Level'
+        # Binary search over the threshold bins instead of an if/elif ladder
+        bins = self._ENHANCED_LEVEL_BINS if use_enhanced else self._BASIC_LEVEL_BINS
+        return self._LEVEL_LABELS[bisect.bisect_right(bins, experience_score)]
 
     def get_primary_skill_category(self, skills):
         """Get the primary skill category for a candidate"""
         if not skills:
             return 'None'
         
+        skills = self._as_skill_set(skills)
+        cached = self._primary_category_cache.get(skills)
+        if cached is not None:
+            return cached
+
         category_counts = {}
         for category, category_skills in self.skill_categories.items():
-            count = sum(1 for skill in skills if skill in category_skills)
+            count = len(skills & category_skills)
             if count > 0:
                 category_counts[category] = count
-        
+
         if not category_counts:
-            return 'Other'
-        
-        return max(category_counts, key=category_counts.get)
\ No newline at end of file
+            primary = 'Other'
+        else:
+            primary = max(category_counts, key=category_counts.get)
+        self._primary_category_cache[skills] = primary
+        return primary
\ No newline at end of file
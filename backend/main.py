@@ -1,5 +1,6 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import pandas as pd
 from pathlib import Path
 import sys
@@ -7,7 +8,32 @@ from typing import Optional, List
 import json
 import numpy as np
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# Optional pyarrow: multithreaded CSV parse plus a feather cache for
+# faster startups after the first load
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional orjson-backed responses: serializes numpy scalars/arrays
+# natively and emits NaN as null, skipping the Python-level recursion
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional polars: multi-threaded filter/top-k engine for the candidates
+# listing (to_pandas on the page slice needs pyarrow as well)
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
 # Add the script's directory to the Python path
 sys.path.append(str(Path(__file__).resolve().parent.parent / 'Scripts'))
@@ -17,7 +43,12 @@ except ImportError:
     print("Warning: hiring_insights module not found. Some features will be limited.")
     HiringInsightsGenerator = None
 
-app = FastAPI(title="HiringSight API", description="AI-Powered Hiring Intelligence Platform", version="1.0.0")
+app = FastAPI(
+    title="HiringSight API",
+    description="AI-Powered Hiring Intelligence Platform",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
 
 # CORS Middleware
 app.add_middleware(
@@ -28,12 +59,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the larger JSON listings on the wire; small responses are
+# left alone so the compression overhead only applies where it pays off
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Global variables
 insights_generator = None
 df = None
+pl_df = None  # Polars mirror of df, when polars is installed
+
+# Aggregates that are static per data load; populated by load_data so the
+# dashboard endpoints serve lookups instead of rescanning the frame
+APP_CACHE = {}
+
+# Fully built payloads for the parameterless endpoints, memoized between
+# data reloads (load_data clears this alongside APP_CACHE)
+RESPONSE_CACHE = {}
 
 def convert_numpy_types(obj):
     """Recursively convert numpy types to native Python types for JSON serialization"""
+    # Fast path: plain Python scalars skip the isinstance chain and the
+    # (comparatively slow) pd.isna call entirely
+    if obj is None or type(obj) in (str, bool, int):
+        return obj
+    if type(obj) is float:
+        return obj if obj == obj else None
     if isinstance(obj, dict):
         return {key: convert_numpy_types(value) for key, value in obj.items()}
     elif isinstance(obj, list):
@@ -95,9 +145,154 @@ def safe_bool(value, default=False):
     except (ValueError, TypeError):
         return default
 
+# Column groups for the /candidates page materializer: each group gets
+# one dtype-specific fill/cast instead of per-cell safe_* calls
+CANDIDATE_STR_COLS = ('name', 'email', 'phone', 'country', 'city', 'continent',
+                      'experience_level', 'primary_skill_category',
+                      'original_skills', 'original_work_experiences')
+CANDIDATE_FLOAT_COLS = ('overall_score', 'enhanced_overall_score',
+                        'salary_full_time', 'skills_diversity_score')
+CANDIDATE_INT_COLS = ('total_skills', 'total_experiences')
+CANDIDATE_BOOL_COLS = ('has_big_tech', 'has_senior_role', 'is_full_stack')
+CANDIDATE_COLUMNS = [
+    'name', 'email', 'phone', 'country', 'city', 'continent',
+    'overall_score', 'enhanced_overall_score', 'salary_full_time',
+    'experience_level', 'primary_skill_category', 'total_skills',
+    'total_experiences', 'has_big_tech', 'has_senior_role',
+    'is_full_stack', 'skills_diversity_score', 'original_skills',
+    'original_work_experiences'
+]
+
+def fast_counts(series):
+    """value_counts for a categorical column via bincount over its codes
+
+    One linear pass over the integer codes instead of the hash-table
+    counting path; returns a descending Series like value_counts. Falls
+    back to value_counts for non-categorical input.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts()
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    order = np.argsort(counts, kind='stable')[::-1]
+    return pd.Series(counts[order], index=series.cat.categories[order])
+
+def build_app_cache(frame):
+    """Precompute the aggregates the dashboard endpoints serve
+
+    Everything here is fixed until the data is reloaded, so /overview,
+    /api/v1/analytics/market and the filter options read these back
+    instead of running nunique/value_counts/groupby per request.
+    """
+    cache = {
+        'country_nunique': int(frame['country'].nunique()) if 'country' in frame.columns else 0,
+        'avg_score': safe_float(frame['overall_score'].mean()),
+        'avg_skills_per_candidate': safe_float(frame['total_skills'].mean()),
+        'big_tech_percentage': safe_float((frame['has_big_tech'].sum() / len(frame)) * 100) if 'has_big_tech' in frame.columns else 0,
+        'skill_counts': fast_counts(frame['primary_skill_category']) if 'primary_skill_category' in frame.columns else pd.Series(dtype=int),
+        'geo_counts': fast_counts(frame['continent']) if 'continent' in frame.columns else pd.Series(dtype=int),
+        'exp_counts': fast_counts(frame['experience_level']) if 'experience_level' in frame.columns else pd.Series(dtype=int)
+    }
+
+    # Skills demand: split + explode + value_counts runs in Cython once,
+    # replacing the per-row Python split loop feeding a Counter
+    if 'original_skills' in frame.columns:
+        exploded_skills = (
+            frame['original_skills'].dropna().astype(str)
+            .str.split(',').explode().str.strip()
+        )
+        cache['skills_demand'] = exploded_skills[exploded_skills != ''].value_counts()
+    else:
+        cache['skills_demand'] = pd.Series(dtype=int)
+
+    # Frequently asked predicates, kept as plain bool arrays so handlers
+    # combine lookups instead of rescanning the float columns
+    scores = frame['overall_score'].to_numpy()
+    salaries = frame['salary_full_time'].to_numpy()
+    cache['high_score_mask'] = scores >= 80
+    # Row positions in descending score order, for the unfiltered
+    # /candidates fast path
+    cache['score_order'] = np.argsort(scores, kind='stable')[::-1]
+    cache['has_salary_mask'] = (salaries > 0) & ~np.isnan(salaries)
+    cache['salary_score_mask'] = cache['has_salary_mask'] & (scores > 0)
+
+    # High-value candidates (score 80+, salary < 100k)
+    high_value_mask = cache['high_score_mask'].copy()
+    if 'salary_full_time' in frame.columns:
+        high_value_mask &= (salaries < 100000) | np.isnan(salaries)
+    cache['high_value_candidates'] = int(high_value_mask.sum())
+
+    # Country statistics for market analytics: one groupby at startup
+    cache['country_stats'] = {}
+    if all(col in frame.columns for col in ['country', 'overall_score', 'salary_full_time']):
+        stats = frame.groupby('country').agg(
+            avg_score=('overall_score', 'mean'),
+            candidate_count=('overall_score', 'size')
+        )
+        salaried_avg = frame[frame['salary_full_time'] > 0].groupby('country')['salary_full_time'].mean()
+        stats['avg_salary'] = salaried_avg.reindex(stats.index).fillna(0)
+        stats = stats[(stats['candidate_count'] >= 3) & (stats.index != 'Unknown')]
+        cache['country_stats'] = {
+            str(country): {
+                'avg_score': safe_float(row.avg_score),
+                'avg_salary': safe_float(row.avg_salary),
+                'candidate_count': int(row.candidate_count)
+            }
+            for country, row in zip(stats.index, stats.itertuples(index=False))
+        }
+
+    # Salary distribution over candidates with both salary and score
+    salary_data = frame.loc[cache['salary_score_mask'], 'salary_full_time']
+    cache['salary_candidate_count'] = int(len(salary_data))
+    if len(salary_data) > 0:
+        q1, median, q3 = salary_data.quantile([0.25, 0.5, 0.75])
+        cache['salary_ranges'] = {
+            "min": safe_float(salary_data.min()),
+            "max": safe_float(salary_data.max()),
+            "median": safe_float(median),
+            "q1": safe_float(q1),
+            "q3": safe_float(q3),
+            "mean": safe_float(salary_data.mean())
+        }
+    else:
+        cache['salary_ranges'] = {}
+
+    # Salary-vs-score scatter sample for the frontend, built once here so
+    # the market endpoint serves the list as-is
+    cache['salary_score_data'] = []
+    scatter_cols = ['overall_score', 'salary_full_time', 'name', 'country',
+                    'primary_skill_category']
+    if all(col in frame.columns for col in scatter_cols):
+        top = frame.loc[cache['salary_score_mask'], scatter_cols].head(100).copy()
+        top['overall_score'] = top['overall_score'].astype(float)
+        top['salary_full_time'] = top['salary_full_time'].astype(float)
+        top['name'] = top['name'].fillna('Unknown').astype(str).str.strip()
+        top['country'] = top['country'].astype(object).fillna('Unknown').astype(str).str.strip()
+        top['primary_skill_category'] = (
+            top['primary_skill_category'].astype(object).fillna('general').astype(str).str.strip()
+        )
+        cache['salary_score_data'] = top.to_dict(orient='records')
+
+    # Filter options are derived from the same fixed columns
+    salaried = frame.loc[cache['has_salary_mask'], 'salary_full_time']
+    cache['filter_options'] = {
+        "countries": sorted([country for country in frame['country'].dropna().unique() if country != 'Unknown'])[:50],
+        "skill_categories": sorted([cat for cat in frame['primary_skill_category'].dropna().unique() if cat != 'general'])[:20],
+        "experience_levels": sorted(frame['experience_level'].dropna().unique().tolist()),
+        "score_range": {
+            "min": safe_float(frame['overall_score'].min()),
+            "max": safe_float(frame['overall_score'].max())
+        },
+        "salary_range": {
+            "min": safe_float(salaried.min()) if len(salaried) > 0 else 0,
+            "max": safe_float(salaried.max()) if len(salaried) > 0 else 200000
+        }
+    }
+    return cache
+
 @app.on_event("startup")
 def load_data():
-    global insights_generator, df
+    global insights_generator, df, pl_df
     try:
         csv_path = Path(__file__).resolve().parent.parent / 'engineered_candidates_final.csv'
         print(f"Looking for data at: {csv_path}")
@@ -106,8 +301,20 @@ def load_data():
             print(f"❌ Data file not found at {csv_path}")
             return
             
-        df = pd.read_csv(csv_path)
-        
+        cache_path = csv_path.with_suffix('.feather')
+        if (PYARROW_AVAILABLE and cache_path.exists()
+                and cache_path.stat().st_mtime >= csv_path.stat().st_mtime):
+            df = pd.read_feather(cache_path)
+            print(f"📦 Loaded feather cache: {cache_path.name}")
+        else:
+            df = pd.read_csv(csv_path, engine='pyarrow' if PYARROW_AVAILABLE else 'c')
+            if PYARROW_AVAILABLE:
+                try:
+                    df.to_feather(cache_path)
+                    print(f"📦 Wrote feather cache: {cache_path.name}")
+                except Exception as cache_error:
+                    print(f"⚠️ Could not write feather cache: {cache_error}")
+
         # Clean and validate data - handle NaN values properly
         print(f"📊 Raw data loaded: {len(df)} rows, {len(df.columns)} columns")
         
@@ -135,9 +342,51 @@ def load_data():
         
         # Remove rows where name is still NaN or empty after filling
         df = df[df['name'].notna() & (df['name'] != '')]
+
+        # Lowercased search blob: concatenating the searchable fields once
+        # here lets /candidates run one substring scan instead of four
+        search_parts = [df['country'], df['original_skills']]
+        if 'original_work_experiences' in df.columns:
+            search_parts.append(df['original_work_experiences'].fillna('').astype(str))
+        df['_search_blob'] = (
+            df['name'].astype(str)
+            .str.cat([part.astype(str) for part in search_parts], sep='|')
+            .str.lower()
+        )
+
+        # Tighten dtypes: low-cardinality strings become dictionary-encoded
+        # categoricals (smaller, faster groupby/value_counts) and the
+        # numeric columns drop to 32-bit
+        for col in ('country', 'continent', 'primary_skill_category',
+                    'experience_level', 'timezone_group'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        df['overall_score'] = df['overall_score'].astype('float32')
+        df['salary_full_time'] = df['salary_full_time'].astype('float32')
+        df['total_skills'] = df['total_skills'].astype('int32')
+        df['total_experiences'] = df['total_experiences'].astype('int32')
+
+        # Mirror the frame into Polars (index kept as _row_id) so the
+        # candidates listing can filter and select pages multi-threaded
+        if POLARS_AVAILABLE and PYARROW_AVAILABLE:
+            pl_df = pl.from_pandas(df.assign(_row_id=df.index.to_numpy()))
+        else:
+            pl_df = None
         
         print(f"✅ Data cleaned and loaded: {len(df)} candidates found")
         print(f"Sample columns: {list(df.columns[:10])}")
+
+        # Precompute the static dashboard aggregates once per load
+        APP_CACHE.clear()
+        RESPONSE_CACHE.clear()
+        APP_CACHE.update(build_app_cache(df))
+        print("✅ Dashboard aggregates precomputed.")
+
+        # Warm the insights blob so the first request skips the parse
+        insights_path = Path(__file__).resolve().parent.parent / 'comprehensive_hiring_insights.json'
+        if insights_path.exists():
+            _cache_insights_blob(insights_path)
+            print("✅ Comprehensive insights pre-serialized.")
         
         # Initialize insights generator if available
         if HiringInsightsGenerator:
@@ -151,13 +400,45 @@ def load_data():
         import traceback
         traceback.print_exc()
         df = None
+        pl_df = None
         insights_generator = None
+        APP_CACHE.clear()
+        RESPONSE_CACHE.clear()
+
+def sanitize_payload(content):
+    """Prepare a payload for serialization
+
+    When orjson responses are active this is a passthrough: orjson
+    serializes numpy scalars/arrays natively and writes NaN as null, so
+    the recursive Python walk only runs on the stdlib-json fallback.
+    """
+    return content if ORJSON_AVAILABLE else convert_numpy_types(content)
+
+def _cache_insights_blob(insights_path):
+    """Parse, sanitize and pre-serialize the insights file once
+
+    The cached bytes are keyed by the file's mtime, so an updated file on
+    disk is picked up without a process restart while repeat requests
+    skip the disk read, the JSON parse and the NaN-scrubbing walk.
+    """
+    mtime = insights_path.stat().st_mtime
+    cached = RESPONSE_CACHE.get('insights_blob')
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(insights_path, 'r', encoding='utf-8') as f:
+        insights_data = json.load(f)
+    # Always run the recursive walk here: the blob is serialized once, and
+    # stdlib json would otherwise write bare NaN into the cached bytes
+    cleaned = convert_numpy_types(insights_data)
+    blob = orjson.dumps(cleaned) if ORJSON_AVAILABLE else json.dumps(cleaned).encode()
+    RESPONSE_CACHE['insights_blob'] = (mtime, blob)
+    return blob
 
 # Custom JSON Response class to handle numpy types
 class CustomJSONResponse:
     """Custom JSON response that handles numpy types"""
     def __init__(self, content):
-        self.content = convert_numpy_types(content)
+        self.content = sanitize_payload(content)
     
     def __dict__(self):
         return self.content
@@ -170,7 +451,7 @@ def read_root():
             "version": "1.0.0",
             "status": "ready",
             "total_candidates": len(df),
-            "countries": int(df['country'].nunique()),
+            "countries": APP_CACHE.get('country_nunique', 0),
             "endpoints": [
                 "/api/v1/overview",
                 "/api/v1/candidates", 
@@ -192,87 +473,34 @@ def get_market_analytics():
     """Get market intelligence data with salary vs score analysis"""
     if df is None:
         raise HTTPException(status_code=503, detail="Data not available")
-    
+
+    # Identical output between reloads — serve the memoized payload
+    if 'market' in RESPONSE_CACHE:
+        return RESPONSE_CACHE['market']
+
     try:
-        # Get candidates with salary data for salary vs score analysis
-        salary_candidates = df[
-            (df['salary_full_time'] > 0) & 
-            (df['overall_score'] > 0) & 
-            df['salary_full_time'].notna() & 
-            df['overall_score'].notna()
-        ].copy()
-        
-        # Prepare salary vs score data for frontend
-        salary_score_data = []
-        for _, row in salary_candidates.head(100).iterrows():  # Limit for performance
-            salary_score_data.append({
-                'overall_score': safe_float(row['overall_score']),
-                'salary_full_time': safe_float(row['salary_full_time']),
-                'name': safe_str(row['name']),
-                'country': safe_str(row['country']),
-                'primary_skill_category': safe_str(row['primary_skill_category'], 'general')
-            })
-        
-        # Skills demand analysis
-        skills_demand = {}
-        if 'original_skills' in df.columns:
-            all_skills = []
-            for skills_str in df['original_skills'].dropna():
-                skills_str = safe_str(skills_str, '')
-                if skills_str:
-                    skills = [skill.strip() for skill in skills_str.split(',') if skill.strip()]
-                    all_skills.extend(skills)
-            
-            from collections import Counter
-            skill_counts = Counter(all_skills)
-            # Get top 20 skills for demand analysis
-            skills_demand = dict(skill_counts.most_common(20))
-        
-        # Country-wise statistics
-        country_stats = {}
-        if all(col in df.columns for col in ['country', 'overall_score', 'salary_full_time']):
-            country_groups = df.groupby('country')
-            
-            for country, group in country_groups:
-                if len(group) >= 3 and country != 'Unknown':
-                    avg_score = safe_float(group['overall_score'].mean())
-                    salary_data = group[group['salary_full_time'] > 0]['salary_full_time']
-                    avg_salary = safe_float(salary_data.mean()) if len(salary_data) > 0 else 0
-                    candidate_count = len(group)
-                    
-                    country_stats[str(country)] = {
-                        'avg_score': avg_score,
-                        'avg_salary': avg_salary,
-                        'candidate_count': candidate_count
-                    }
-        
-        # Skill category distribution
-        skill_distribution = {}
-        if 'primary_skill_category' in df.columns:
-            skill_counts = df['primary_skill_category'].value_counts()
-            skill_distribution = {str(k): int(v) for k, v in skill_counts.items() 
-                                if k not in ['general', 'Unknown', None]}
-        
-        # Experience level distribution
-        experience_distribution = {}
-        if 'experience_level' in df.columns:
-            exp_counts = df['experience_level'].value_counts()
-            experience_distribution = {str(k): int(v) for k, v in exp_counts.items() 
-                                     if k not in ['Unknown', None]}
-        
-        # Salary ranges
-        salary_ranges = {}
-        if len(salary_candidates) > 0:
-            salary_data = salary_candidates['salary_full_time']
-            salary_ranges = {
-                "min": safe_float(salary_data.min()),
-                "max": safe_float(salary_data.max()),
-                "median": safe_float(salary_data.median()),
-                "q1": safe_float(salary_data.quantile(0.25)),
-                "q3": safe_float(salary_data.quantile(0.75)),
-                "mean": safe_float(salary_data.mean())
-            }
+        # Salary vs score sample for the frontend, prepared at load time
+        salary_score_data = APP_CACHE.get('salary_score_data', [])
+
+        # Skills demand analysis: top 20 from the counts cached at load
+        skills_demand = {
+            str(k): int(v)
+            for k, v in APP_CACHE.get('skills_demand', pd.Series(dtype=int)).head(20).items()
+        }
         
+        # Country-wise statistics, distributions, and salary ranges all
+        # come from the aggregates precomputed at load time
+        country_stats = APP_CACHE.get('country_stats', {})
+        skill_distribution = {
+            str(k): int(v) for k, v in APP_CACHE.get('skill_counts', pd.Series(dtype=int)).items()
+            if k not in ['general', 'Unknown', None]
+        }
+        experience_distribution = {
+            str(k): int(v) for k, v in APP_CACHE.get('exp_counts', pd.Series(dtype=int)).items()
+            if k not in ['Unknown', None]
+        }
+        salary_ranges = APP_CACHE.get('salary_ranges', {})
+
         response_data = {
             "salary_score_data": salary_score_data,
             "high_demand_skills": skills_demand,
@@ -282,14 +510,15 @@ def get_market_analytics():
             "salary_ranges": salary_ranges,
             "market_insights": {
                 "total_countries": len(country_stats),
-                "avg_skills_per_candidate": safe_float(df['total_skills'].mean()),
-                "big_tech_percentage": safe_float((df['has_big_tech'].sum() / len(df)) * 100) if 'has_big_tech' in df.columns else 0,
-                "total_candidates_with_salary": len(salary_candidates)
+                "avg_skills_per_candidate": APP_CACHE.get('avg_skills_per_candidate', 0),
+                "big_tech_percentage": APP_CACHE.get('big_tech_percentage', 0),
+                "total_candidates_with_salary": APP_CACHE.get('salary_candidate_count', 0)
             }
         }
         
-        return CustomJSONResponse(response_data)
-        
+        RESPONSE_CACHE['market'] = CustomJSONResponse(response_data)
+        return RESPONSE_CACHE['market']
+
     except Exception as e:
         print(f"Error in market analytics: {e}")
         import traceback
@@ -300,15 +529,16 @@ def get_market_analytics():
 def get_comprehensive_insights():
     """Get comprehensive hiring insights with proper NaN handling"""
     try:
-        # Try to load from JSON file first
+        # Try to load from JSON file first: served as pre-serialized bytes
         insights_path = Path(__file__).resolve().parent.parent / 'comprehensive_hiring_insights.json'
         if insights_path.exists():
-            with open(insights_path, 'r', encoding='utf-8') as f:
-                insights_data = json.load(f)
-            
-            # Clean the insights data to remove NaN values
-            cleaned_insights = convert_numpy_types(insights_data)
-            return CustomJSONResponse(cleaned_insights).content
+            return Response(
+                content=_cache_insights_blob(insights_path),
+                media_type='application/json'
+            )
+
+        if 'insights' in RESPONSE_CACHE:
+            return RESPONSE_CACHE['insights']
         
         # Fallback to generated insights if file doesn't exist
         if not insights_generator:
@@ -316,7 +546,7 @@ def get_comprehensive_insights():
                 raise HTTPException(status_code=503, detail="Data not available")
             
             total_candidates = len(df)
-            high_scores = len(df[df['overall_score'] >= 80]) if 'overall_score' in df.columns else 0
+            high_scores = int(APP_CACHE['high_score_mask'].sum()) if 'high_score_mask' in APP_CACHE else 0
             countries = int(df['country'].nunique()) if 'country' in df.columns else 0
             
             fallback_insights = {
@@ -348,8 +578,9 @@ def get_comprehensive_insights():
         
         # Use insights generator
         comprehensive_insights = insights_generator.generate_comprehensive_report()
-        cleaned_insights = convert_numpy_types(comprehensive_insights)
-        return CustomJSONResponse(cleaned_insights).content
+        cleaned_insights = sanitize_payload(comprehensive_insights)
+        RESPONSE_CACHE['insights'] = CustomJSONResponse(cleaned_insights).content
+        return RESPONSE_CACHE['insights']
         
     except Exception as e:
         print(f"Error generating insights: {e}")
@@ -362,50 +593,31 @@ def get_overview():
     """Get dashboard overview statistics"""
     if df is None:
         raise HTTPException(status_code=503, detail="Data not available")
-    
+
+    if 'overview' in RESPONSE_CACHE:
+        return RESPONSE_CACHE['overview']
+
     try:
-        total_candidates = len(df)
-        
-        # Calculate statistics with safe conversions
-        avg_score = safe_float(df['overall_score'].mean())
-        countries = int(df['country'].nunique()) if 'country' in df.columns else 0
-        
-        # High-value candidates (score 80+, salary < 100k)
-        high_value_mask = (df['overall_score'] >= 80)
-        if 'salary_full_time' in df.columns:
-            salary_mask = (df['salary_full_time'] < 100000) | df['salary_full_time'].isna()
-            high_value_mask = high_value_mask & salary_mask
-        
-        high_value_candidates = int(high_value_mask.sum())
-        
-        # Skill distribution
-        skill_distribution = {}
-        if 'primary_skill_category' in df.columns:
-            skill_counts = df['primary_skill_category'].value_counts()
-            skill_distribution = {str(k): int(v) for k, v in skill_counts.head(10).items()}
-        
-        # Geographic distribution
-        geographic_distribution = {}
-        if 'continent' in df.columns:
-            geo_counts = df['continent'].value_counts()
-            geographic_distribution = {str(k): int(v) for k, v in geo_counts.items()}
-        
-        # Experience distribution
-        experience_distribution = {}
-        if 'experience_level' in df.columns:
-            exp_counts = df['experience_level'].value_counts()
-            experience_distribution = {str(k): int(v) for k, v in exp_counts.items()}
-        
-        return {
-            "total_candidates": total_candidates,
-            "average_score": avg_score,
-            "countries": countries,
-            "high_value_candidates": high_value_candidates,
+        # Everything here was aggregated once at load time
+        skill_counts = APP_CACHE.get('skill_counts', pd.Series(dtype=int))
+        geo_counts = APP_CACHE.get('geo_counts', pd.Series(dtype=int))
+        exp_counts = APP_CACHE.get('exp_counts', pd.Series(dtype=int))
+
+        skill_distribution = {str(k): int(v) for k, v in skill_counts.head(10).items()}
+        geographic_distribution = {str(k): int(v) for k, v in geo_counts.items()}
+        experience_distribution = {str(k): int(v) for k, v in exp_counts.items()}
+
+        RESPONSE_CACHE['overview'] = {
+            "total_candidates": len(df),
+            "average_score": APP_CACHE.get('avg_score', 0.0),
+            "countries": APP_CACHE.get('country_nunique', 0),
+            "high_value_candidates": APP_CACHE.get('high_value_candidates', 0),
             "skill_distribution": skill_distribution,
             "geographic_distribution": geographic_distribution,
             "experience_distribution": experience_distribution,
             "last_updated": "2024-01-28"
         }
+        return RESPONSE_CACHE['overview']
         
     except Exception as e:
         print(f"Error generating overview: {e}")
@@ -430,99 +642,149 @@ def get_candidates(
         raise HTTPException(status_code=503, detail="Data not available")
     
     try:
-        # Start with all candidates
-        filtered_df = df.copy()
-        
-        # Apply filters
-        if min_score > 0:
-            filtered_df = filtered_df[filtered_df['overall_score'] >= min_score]
-        
-        if max_score < 100:
-            filtered_df = filtered_df[filtered_df['overall_score'] <= max_score]
-        
-        if min_salary > 0:
-            filtered_df = filtered_df[
-                (filtered_df['salary_full_time'] >= min_salary) | 
-                (filtered_df['salary_full_time'].isna())
-            ]
-        
-        if max_salary < 999999:
-            filtered_df = filtered_df[
-                (filtered_df['salary_full_time'] <= max_salary) | 
-                (filtered_df['salary_full_time'].isna())
-            ]
-        
-        if country:
-            filtered_df = filtered_df[
-                filtered_df['country'].str.contains(country, case=False, na=False)
-            ]
-        
-        if skill_category:
-            filtered_df = filtered_df[
-                filtered_df['primary_skill_category'].str.contains(skill_category, case=False, na=False)
-            ]
-        
-        if experience_level:
-            filtered_df = filtered_df[
-                filtered_df['experience_level'].str.contains(experience_level, case=False, na=False)
-            ]
-        
-        if has_big_tech is not None:
-            filtered_df = filtered_df[filtered_df['has_big_tech'] == has_big_tech]
-        
-        # Search functionality
-        if search:
-            search_mask = (
-                filtered_df['name'].str.contains(search, case=False, na=False) |
-                filtered_df['country'].str.contains(search, case=False, na=False) |
-                filtered_df['original_skills'].str.contains(search, case=False, na=False) |
-                filtered_df['original_work_experiences'].str.contains(search, case=False, na=False)
+        # Default dashboard query: no filter active, so the page is just
+        # a slice of the precomputed descending score order
+        no_filters = (
+            min_score <= 0 and max_score >= 100 and min_salary <= 0
+            and max_salary >= 999999 and not country and not skill_category
+            and not experience_level and has_big_tech is None and not search
+        )
+        if no_filters and 'score_order' in APP_CACHE:
+            total_filtered = len(df)
+            paginated_df = df.iloc[APP_CACHE['score_order'][offset:offset + limit]]
+        elif pl_df is not None:
+            # Polars path: filters, top-k and the page slice run on the
+            # multi-threaded engine; only the page converts back to pandas
+            exprs = []
+            if min_score > 0:
+                exprs.append(pl.col('overall_score') >= min_score)
+            if max_score < 100:
+                exprs.append(pl.col('overall_score') <= max_score)
+            if min_salary > 0:
+                exprs.append((pl.col('salary_full_time') >= min_salary) |
+                             pl.col('salary_full_time').is_null())
+            if max_salary < 999999:
+                exprs.append((pl.col('salary_full_time') <= max_salary) |
+                             pl.col('salary_full_time').is_null())
+            if country:
+                exprs.append(pl.col('country').cast(pl.Utf8).str.to_lowercase()
+                             .str.contains(country.lower(), literal=True))
+            if skill_category:
+                exprs.append(pl.col('primary_skill_category').cast(pl.Utf8)
+                             .str.to_lowercase()
+                             .str.contains(skill_category.lower(), literal=True))
+            if experience_level:
+                exprs.append(pl.col('experience_level').cast(pl.Utf8)
+                             .str.to_lowercase()
+                             .str.contains(experience_level.lower(), literal=True))
+            if has_big_tech is not None:
+                exprs.append(pl.col('has_big_tech') == has_big_tech)
+            if search:
+                exprs.append(pl.col('_search_blob')
+                             .str.contains(search.lower(), literal=True))
+
+            filtered = pl_df.filter(exprs) if exprs else pl_df
+            total_filtered = filtered.height
+            paginated_df = (
+                filtered.top_k(offset + limit, by='overall_score')
+                .slice(offset, limit)
+                .to_pandas()
+                .set_index('_row_id')
             )
-            filtered_df = filtered_df[search_mask]
-        
-        # Sort by overall score (descending)
-        filtered_df = filtered_df.sort_values('overall_score', ascending=False)
-        
-        # Get total count before pagination
-        total_filtered = len(filtered_df)
-        
-        # Apply pagination
-        paginated_df = filtered_df.iloc[offset:offset + limit]
-        
-        # Convert to list of dictionaries with safe type conversion
-        candidates = []
-        for _, row in paginated_df.iterrows():
-            candidate = {
-                'id': int(row.name),  # Use index as ID
-                'name': safe_str(row['name']),
-                'email': safe_str(row['email']),
-                'phone': safe_str(row['phone']),
-                'country': safe_str(row['country']),
-                'city': safe_str(row['city']),
-                'continent': safe_str(row['continent']),
-                'overall_score': safe_float(row['overall_score']),
-                'enhanced_overall_score': safe_float(row.get('enhanced_overall_score', row['overall_score'])),
-                'salary_full_time': safe_float(row['salary_full_time']),
-                'experience_level': safe_str(row['experience_level']),
-                'primary_skill_category': safe_str(row['primary_skill_category']),
-                'total_skills': safe_int(row['total_skills']),
-                'total_experiences': safe_int(row['total_experiences']),
-                'has_big_tech': bool(row.get('has_big_tech', False)),
-                'has_senior_role': bool(row.get('has_senior_role', False)),
-                'is_full_stack': bool(row.get('is_full_stack', False)),
-                'skills_diversity_score': safe_float(row.get('skills_diversity_score', 0)),
-                'original_skills': safe_str(row.get('original_skills', '')),
-                'original_work_experiences': safe_str(row.get('original_work_experiences', ''))
-            }
-            candidates.append(candidate)
-        
-        return {
-            "candidates": candidates,
+        else:
+            # Accumulate every filter into one boolean mask and index the
+            # frame once at the end — no df.copy() and no intermediate frames
+            mask = np.ones(len(df), dtype=bool)
+
+            if min_score > 0:
+                mask &= (df['overall_score'] >= min_score).values
+
+            if max_score < 100:
+                mask &= (df['overall_score'] <= max_score).values
+
+            if min_salary > 0:
+                mask &= ((df['salary_full_time'] >= min_salary) |
+                         df['salary_full_time'].isna()).values
+
+            if max_salary < 999999:
+                mask &= ((df['salary_full_time'] <= max_salary) |
+                         df['salary_full_time'].isna()).values
+
+            if country:
+                mask &= df['country'].str.contains(country, case=False, na=False).values
+
+            if skill_category:
+                mask &= df['primary_skill_category'].str.contains(
+                    skill_category, case=False, na=False
+                ).values
+
+            if experience_level:
+                mask &= df['experience_level'].str.contains(
+                    experience_level, case=False, na=False
+                ).values
+
+            if has_big_tech is not None:
+                mask &= (df['has_big_tech'] == has_big_tech).values
+
+            # Search: single literal scan over the lowercase blob
+            if search:
+                mask &= df['_search_blob'].str.contains(
+                    search.lower(), regex=False, na=False
+                ).values
+
+            # Total count comes straight off the mask; only the top
+            # offset+limit rows ever need ordering, so nlargest (partial
+            # selection, O(N)) replaces a full sort of the filtered frame
+            total_filtered = int(mask.sum())
+            filtered_df = df.iloc[np.flatnonzero(mask)]
+            top = filtered_df.nlargest(offset + limit, 'overall_score')
+
+            # Apply pagination
+            paginated_df = top.iloc[offset:offset + limit]
+        
+        # Materialize the page column-wise: per-column fills replace the
+        # per-row safe_* calls, then one to_dict over the small page
+        page = paginated_df.reindex(columns=CANDIDATE_COLUMNS)
+        page['enhanced_overall_score'] = page['enhanced_overall_score'].fillna(
+            page['overall_score']
+        )
+        for col in CANDIDATE_STR_COLS:
+            # astype(object) first: fillna with an off-dictionary value
+            # would raise on the categorical columns
+            page[col] = page[col].astype(object).fillna('Unknown').astype(str).str.strip()
+        for col in CANDIDATE_FLOAT_COLS:
+            page[col] = page[col].fillna(0.0).astype(float)
+        for col in CANDIDATE_INT_COLS:
+            page[col] = page[col].fillna(0).astype(int)
+        for col in CANDIDATE_BOOL_COLS:
+            page[col] = page[col].fillna(False).astype(bool)
+        page.insert(0, 'id', paginated_df.index.astype(int))  # Use index as ID
+        candidates = page.to_dict(orient='records')
+
+        meta = {
             "total_filtered": total_filtered,
             "total_returned": len(candidates),
             "has_more": (offset + limit) < total_filtered,
             "next_offset": offset + limit if (offset + limit) < total_filtered else None
         }
+
+        if ORJSON_AVAILABLE:
+            dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            dumps = lambda obj: json.dumps(obj).encode()
+
+        # Stream the page row by row: the socket starts writing after the
+        # first row instead of buffering the whole serialized body, and
+        # peak memory stays flat when clients raise the limit
+        def body():
+            yield b'{"candidates":['
+            for i, row in enumerate(candidates):
+                if i:
+                    yield b','
+                yield dumps(row)
+            yield b'],' + dumps(meta)[1:]
+
+        return StreamingResponse(body(), media_type="application/json")
         
     except Exception as e:
         print(f"Error filtering candidates: {e}")
@@ -536,22 +798,9 @@ def get_filter_options():
         raise HTTPException(status_code=503, detail="Data not available")
     
     try:
-        options = {
-            "countries": sorted([country for country in df['country'].dropna().unique() if country != 'Unknown'])[:50],
-            "skill_categories": sorted([cat for cat in df['primary_skill_category'].dropna().unique() if cat != 'general'])[:20],
-            "experience_levels": sorted(df['experience_level'].dropna().unique().tolist()),
-            "score_range": {
-                "min": safe_float(df['overall_score'].min()),
-                "max": safe_float(df['overall_score'].max())
-            },
-            "salary_range": {
-                "min": safe_float(df[df['salary_full_time'] > 0]['salary_full_time'].min()) if len(df[df['salary_full_time'] > 0]) > 0 else 0,
-                "max": safe_float(df[df['salary_full_time'] > 0]['salary_full_time'].max()) if len(df[df['salary_full_time'] > 0]) > 0 else 200000
-            }
-        }
-        
-        return options
-        
+        # Derived once per data load
+        return APP_CACHE.get('filter_options', {})
+
     except Exception as e:
         print(f"Error getting filter options: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting filter options: {str(e)}")
@@ -563,28 +812,17 @@ def get_data_sample():
         return {"error": "Data not loaded"}
     
     try:
-        # Get sample with safe conversions
-        sample_data = []
-        for idx, row in df.head(3).iterrows():
-            safe_row = {}
-            for col, value in row.items():
-                if pd.isna(value):
-                    safe_row[col] = None
-                elif isinstance(value, (np.integer, np.floating)):
-                    if np.isnan(value):
-                        safe_row[col] = None
-                    else:
-                        safe_row[col] = float(value) if isinstance(value, np.floating) else int(value)
-                else:
-                    safe_row[col] = str(value)
-            sample_data.append(safe_row)
-        
+        # One columnar NaN->None pass over the three sample rows instead
+        # of iterrows with per-cell isinstance checks
+        head = df.head(3)
+        sample_data = head.astype(object).where(head.notna(), None).to_dict(orient='records')
+
         return {
             "total_rows": len(df),
             "columns": list(df.columns),
             "sample_data": sample_data,
-            "data_types": {col: str(dtype) for col, dtype in df.dtypes.items()},
-            "null_counts": {col: int(count) for col, count in df.isnull().sum().items()}
+            "data_types": df.dtypes.astype(str).to_dict(),
+            "null_counts": df.isnull().sum().astype(int).to_dict()
         }
     except Exception as e:
         print(f"Error in debug endpoint: {e}")